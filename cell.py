@@ -1,38 +1,189 @@
 # cell.py
 import logging
+from array import array
+
+import numpy as np
 
 logger = logging.getLogger('cell')
 
+# Cached debug-enabled flag so hot constructors skip both the f-string build
+# and the logging call entirely when debug logging is off. Re-evaluated by
+# Config.setup_logging after log levels are configured.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+class CellStore:
+    """Structure-of-arrays backing store for per-cell data.
+
+    Keeping x/y/energy/age/organism_id in parallel NumPy arrays lets the
+    tick loop and statistics run vectorized passes (energy drain, death
+    masks, reductions) over all live cells instead of touching thousands
+    of Python objects. Slots of dead cells are recycled via a freelist.
+    """
+
+    def __init__(self, capacity=1024):
+        logger.debug("Initializing cell store with capacity %d", capacity)
+
+        self.capacity = capacity
+        # Positions fit comfortably in int16 (world dimensions are ~1024),
+        # which halves the bytes the per-frame cull and per-tick passes
+        # stream through cache compared to int32
+        self.x = np.zeros(capacity, dtype=np.int16)
+        self.y = np.zeros(capacity, dtype=np.int16)
+        self.energy = np.zeros(capacity, dtype=np.int32)
+        self.age = np.zeros(capacity, dtype=np.int32)
+        self.organism_id = np.zeros(capacity, dtype=np.int32)
+        self.cell_id = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self._free = []  # Recycled slot indices
+        self._next_slot = 0
+
+    def allocate(self, x, y, organism_id, energy=100, age=0, cell_id=-1):
+        """Claim a slot for a new cell and return its index"""
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._next_slot >= self.capacity:
+                self._grow()
+            slot = self._next_slot
+            self._next_slot += 1
+
+        self.x[slot] = x
+        self.y[slot] = y
+        self.energy[slot] = energy
+        self.age[slot] = age
+        self.organism_id[slot] = organism_id
+        self.cell_id[slot] = cell_id
+        self.alive[slot] = True
+        return slot
+
+    def free(self, slot):
+        """Release a slot so it can be reused"""
+        self.alive[slot] = False
+        self._free.append(slot)
+
+    def _grow(self):
+        """Double capacity, preserving existing slot data"""
+        new_capacity = self.capacity * 2
+        logger.debug("Growing cell store: %d -> %d slots", self.capacity, new_capacity)
+
+        for name in ('x', 'y', 'energy', 'age', 'organism_id', 'cell_id', 'alive'):
+            old = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=old.dtype)
+            grown[:self.capacity] = old
+            setattr(self, name, grown)
+
+        self.capacity = new_capacity
+
 class Cell:
-    def __init__(self, id, x, y, organism_id):
+    """Thin view over one CellStore slot.
+
+    Attribute access goes through properties into the backing arrays, so
+    scalar reads stay source-compatible while bulk operations can work on
+    the store directly.
+    """
+
+    __slots__ = ('id', '_store', '_slot')
+
+    def __init__(self, id, store, slot):
         self.id = id
-        self.x = x
-        self.y = y
-        self.organism_id = organism_id
-        self.energy = 100
-        self.age = 0
-        
-        logger.debug(f"Created cell {id} at ({x}, {y}) for organism {organism_id}")
+        self._store = store
+        self._slot = slot
+
+        if __debug__ and _DEBUG:
+            logger.debug("Created cell %d at (%d, %d) for organism %d",
+                         id, store.x[slot], store.y[slot], store.organism_id[slot])
+
+    @property
+    def x(self):
+        return int(self._store.x[self._slot])
+
+    @x.setter
+    def x(self, value):
+        self._store.x[self._slot] = value
+
+    @property
+    def y(self):
+        return int(self._store.y[self._slot])
+
+    @y.setter
+    def y(self, value):
+        self._store.y[self._slot] = value
+
+    @property
+    def energy(self):
+        return int(self._store.energy[self._slot])
+
+    @energy.setter
+    def energy(self, value):
+        self._store.energy[self._slot] = value
+
+    @property
+    def age(self):
+        return int(self._store.age[self._slot])
+
+    @age.setter
+    def age(self, value):
+        self._store.age[self._slot] = value
+
+    @property
+    def organism_id(self):
+        return int(self._store.organism_id[self._slot])
+
+    @organism_id.setter
+    def organism_id(self, value):
+        self._store.organism_id[self._slot] = value
+
+class CellIdList:
+    """Compact container for an organism's cell ids.
+
+    Organisms hold few cells, so a flat int array beats a set here:
+    4 bytes per entry instead of ~50, cache-friendly iteration, and O(1)
+    removal via swap-with-last. Keeps the add/discard API of the set it
+    replaces.
+    """
+
+    __slots__ = ('_ids',)
+
+    def __init__(self):
+        self._ids = array('i')
+
+    def add(self, cell_id):
+        if cell_id not in self._ids:
+            self._ids.append(cell_id)
+
+    def discard(self, cell_id):
+        try:
+            idx = self._ids.index(cell_id)
+        except ValueError:
+            return
+        self._ids[idx] = self._ids[-1]
+        self._ids.pop()
+
+    def __contains__(self, cell_id):
+        return cell_id in self._ids
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
 
 class Organism:
-    def __init__(self, id, genome, traits):
+    __slots__ = ('id', 'genome', 'traits', 'flags', 'cell_ids', 'birth_tick',
+                 'color', 'color_id')
+
+    def __init__(self, id, genome, parsed):
         self.id = id
         self.genome = genome
-        self.traits = traits
-        self.cell_ids = set()
+        self.traits = parsed.traits
+        self.flags = parsed.flags
+        self.cell_ids = CellIdList()
         self.birth_tick = 0
-        self.color = self._extract_color()
-        
-        logger.debug(f"Created organism {id} with genome '{genome}' and traits {traits}")
-        logger.debug(f"Organism {id} assigned color: {self.color}")
-    
-    def _extract_color(self):
-        """Extract color from traits"""
-        for trait in self.traits:
-            if trait.startswith("Color:"):
-                color = trait.split(":")[1]
-                logger.debug(f"Extracted color '{color}' from trait '{trait}'")
-                return color
-        
-        logger.debug("No color trait found, defaulting to Green")
-        return "Green"
\ No newline at end of file
+        # Color comes straight from the parse pass - no second traits scan.
+        # color_id is the integer palette index the renderer gathers on.
+        self.color = parsed.color
+        self.color_id = parsed.color_id
+
+        if __debug__ and _DEBUG:
+            logger.debug("Created organism %d with genome '%s' and traits %s", id, genome, self.traits)
+            logger.debug("Organism %d assigned color: %s", id, self.color)
@@ -1,5 +1,6 @@
 # config.py
 import logging
+import logging.handlers
 import sys
 from datetime import datetime
 
@@ -12,6 +13,7 @@ class Config:
     SCREEN_WIDTH = 800
     SCREEN_HEIGHT = 600
     FPS = 30
+    SIM_TICK_RATE = 30  # Simulation thread ticks per second, independent of FPS
     
     # Energy System - FIXED FOR SURVIVAL
     STARTING_ENERGY = 200  # Increased from 100
@@ -38,6 +40,8 @@ class Config:
     STATS_UPDATE_INTERVAL = 10  # Update stats every N ticks for performance
     
     # Logging
+    # Hot-path debug logging is written as 'if __debug__ and _DEBUG:' so
+    # running 'python -O main.py' compiles those blocks out entirely
     LOG_LEVEL = logging.DEBUG  # Change to INFO, WARNING, or ERROR as needed
     LOG_TO_FILE = True
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -46,11 +50,6 @@ class Config:
     @classmethod
     def setup_logging(cls):
         """Configure logging for the entire application"""
-        # Create logs directory if it doesn't exist
-        import os
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
-        
         # Create logger
         logger = logging.getLogger()
         logger.setLevel(cls.LOG_LEVEL)
@@ -67,13 +66,21 @@ class Config:
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
         
-        # File handler for detailed logs - shows all levels
+        # File handler for detailed logs - shows all levels. Records are
+        # buffered in memory and only flushed to disk in batches (or
+        # immediately on WARNING+), so debug-heavy ticks don't issue a
+        # write() syscall per record. delay=True defers creating the file
+        # until the first flush, so short runs don't litter empty logs.
         if cls.LOG_TO_FILE:
+            import os
+            os.makedirs('logs', exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            file_handler = logging.FileHandler(f'logs/simulation_{timestamp}.log')
+            file_handler = logging.FileHandler(f'logs/simulation_{timestamp}.log', delay=True)
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=1024, flushLevel=logging.WARNING, target=file_handler)
+            logger.addHandler(buffered_handler)
         
         # Set specific logger levels for different modules
         logging.getLogger('world').setLevel(cls.LOG_LEVEL)
@@ -83,7 +90,17 @@ class Config:
         logging.getLogger('renderer').setLevel(cls.LOG_LEVEL)
         logging.getLogger('main').setLevel(cls.LOG_LEVEL)
         logging.getLogger('stats').setLevel(cls.LOG_LEVEL)
-        
+
+        # Refresh cached debug flags now that levels are final, so hot paths
+        # test a bare module global instead of calling isEnabledFor per call
+        import cell, dna, food, renderer, stats, world
+        cell._DEBUG = logging.getLogger('cell').isEnabledFor(logging.DEBUG)
+        dna._DEBUG = logging.getLogger('dna').isEnabledFor(logging.DEBUG)
+        food._DEBUG = logging.getLogger('food').isEnabledFor(logging.DEBUG)
+        renderer._DEBUG = logging.getLogger('renderer').isEnabledFor(logging.DEBUG)
+        stats._DEBUG = logging.getLogger('stats').isEnabledFor(logging.DEBUG)
+        world._DEBUG = logging.getLogger('world').isEnabledFor(logging.DEBUG)
+
         logger.info("Logging system initialized")
         logger.debug(f"Log level set to: {logging.getLevelName(cls.LOG_LEVEL)}")
         logger.debug(f"Logging to file: {cls.LOG_TO_FILE}")
\ No newline at end of file
@@ -5,118 +5,191 @@ import logging
 
 logger = logging.getLogger('dna')
 
+# Cached debug-enabled flag so the parse/mutate hot paths skip logging with a
+# single global check instead of walking the logger hierarchy per call.
+# Refreshed by Config.setup_logging after levels are configured.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+# Trait flag bits, precomputed at parse time for O(1) queries in the tick loop
+CAN_MOVE = 1 << 0
+CAN_EAT = 1 << 1
+
+# Display colors a genome can encode. The tuple index is a stable integer
+# palette id assigned at parse time, so the renderer can gather colors with
+# array indexing instead of per-cell string/dict lookups.
+COLOR_NAMES = ("Green", "Blue", "Red", "Yellow", "Purple")
+_COLOR_IDS = {name: i for i, name in enumerate(COLOR_NAMES)}
+
+# Parse results memoized by genome string. Reproduction re-parses the
+# parent genome whenever mutate() returns it unchanged (the common case
+# at a 1% mutation rate), so a hit skips the regex scan and trait walk
+# entirely. Bounded so a mutation-heavy run cannot grow it forever.
+_PARSE_CACHE_SIZE = 1024
+
+# Characters a point mutation can substitute in
+_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz:[]'
+
+# Traits an insert mutation can add, fixed so mutate() doesn't rebuild the list
+_INSERT_TRAITS = (
+    "[CanMove]",
+    "[CanEat]",
+    "[Color:Red]",
+    "[Color:Blue]",
+    "[Color:Yellow]",
+    "[Color:Purple]"
+)
+
+class ParsedGenome:
+    """Result of parsing a genome: the trait list plus values derived during
+    the same pass (display color and behavior flag bits), so callers don't
+    re-scan the traits afterwards."""
+
+    __slots__ = ('traits', 'color', 'color_id', 'flags')
+
+    def __init__(self, traits, color, flags):
+        self.traits = traits
+        self.color = color
+        # Unknown color names fall back to Green, matching the renderer's
+        # historical default
+        self.color_id = _COLOR_IDS.get(color, 0)
+        self.flags = flags
+
 class DNAParser:
+    # The trait pattern is constant, so compile it once at class level and
+    # bind findall up front to skip two attribute lookups per parse/mutate
+    _TRAIT_RE = re.compile(r'\[([^\]]+)\]')
+    _findall = _TRAIT_RE.findall
+
     def __init__(self):
-        self.trait_pattern = re.compile(r'\[([^\]]+)\]')
         self.stats = None  # Will be set if stats tracking is enabled
-        logger.debug("DNAParser initialized with trait pattern")
-    
+        self._parse_cache = {}  # genome string -> ParsedGenome
+        if __debug__ and _DEBUG:
+            logger.debug("DNAParser initialized with trait pattern")
+
     def set_stats_tracker(self, stats):
         """Set the statistics tracker"""
         self.stats = stats
-        logger.debug("Statistics tracker linked to DNA parser")
-    
+        if __debug__ and _DEBUG:
+            logger.debug("Statistics tracker linked to DNA parser")
+
     def parse(self, genome):
-        """Parse genome string into traits list"""
-        logger.debug(f"Parsing genome: '{genome}'")
-        
-        traits = []
-        matches = self.trait_pattern.findall(genome)
-        
+        """Parse genome string into a ParsedGenome (memoized per genome)"""
+        cached = self._parse_cache.get(genome)
+        if cached is not None:
+            return cached
+
+        if __debug__ and _DEBUG:
+            logger.debug("Parsing genome: '%s'", genome)
+
+        matches = self._findall(genome)
+
         if not matches:
             logger.warning(f"No trait patterns found in genome '{genome}'")
             return None
-        
+
         if "Cell" not in matches:
             logger.warning(f"Required 'Cell' trait not found in genome '{genome}', found traits: {matches}")
             return None  # Invalid genome
-        
+
+        # Derive color and behavior flags in the same pass over the traits
+        color = None
+        flags = 0
         for match in matches:
-            traits.append(match)
-            logger.debug(f"Found trait: '{match}'")
-        
-        logger.debug(f"Successfully parsed {len(traits)} traits from genome: {traits}")
-        return traits
-    
+            if match == "CanMove":
+                flags |= CAN_MOVE
+            elif match == "CanEat":
+                flags |= CAN_EAT
+            elif color is None and match.startswith("Color:"):
+                color = match.split(":")[1]
+            if __debug__ and _DEBUG:
+                logger.debug("Found trait: '%s'", match)
+
+        if __debug__ and _DEBUG:
+            logger.debug("Successfully parsed %d traits from genome: %s", len(matches), matches)
+
+        parsed = ParsedGenome(matches, color or "Green", flags)
+        if len(self._parse_cache) >= _PARSE_CACHE_SIZE:
+            self._parse_cache.clear()
+        self._parse_cache[genome] = parsed
+        return parsed
+
     def mutate(self, genome, rate=0.01):
         """Mutate genome with given rate"""
-        logger.debug(f"Attempting mutation on genome '{genome}' with rate {rate}")
-        
+        if __debug__ and _DEBUG:
+            logger.debug("Attempting mutation on genome '%s' with rate %s", genome, rate)
+
         if random.random() > rate:
-            logger.debug("No mutation occurred (random roll failed)")
+            if __debug__ and _DEBUG:
+                logger.debug("No mutation occurred (random roll failed)")
             return genome
-        
-        mutation_type = random.choices(
-            ['point', 'insert', 'delete'],
-            weights=[0.7, 0.2, 0.1]
-        )[0]
-        
-        logger.debug(f"Mutation type selected: {mutation_type}")
-        
+
+        # Threshold ladder instead of random.choices: same 0.7/0.2/0.1 weights
+        # without building cumulative weights and a result list per call
+        roll = random.random()
+        mutation_type = 'point' if roll < 0.7 else ('insert' if roll < 0.9 else 'delete')
+
+        if __debug__ and _DEBUG:
+            logger.debug("Mutation type selected: %s", mutation_type)
+
         if mutation_type == 'point':
             # Change one character
             if len(genome) == 0:
                 logger.warning("Cannot perform point mutation on empty genome")
                 return genome
-                
+
+            # Splice instead of list(genome)/''.join: three allocations
+            # total rather than one 1-char string per genome character
             pos = random.randint(0, len(genome)-1)
-            chars = list(genome)
-            old_char = chars[pos]
-            chars[pos] = random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz:[]')
-            new_genome = ''.join(chars)
-            
-            logger.info(f"Point mutation: '{genome}' -> '{new_genome}' (position {pos}: '{old_char}' -> '{chars[pos]}')")
-            
+            old_char = genome[pos]
+            new_char = random.choice(_ALPHABET)
+            new_genome = genome[:pos] + new_char + genome[pos+1:]
+
+            logger.info(f"Point mutation: '{genome}' -> '{new_genome}' (position {pos}: '{old_char}' -> '{new_char}')")
+
             # Record mutation in stats if available
             if self.stats and new_genome != genome:
                 self.stats.tick_mutations += 1
                 self.stats.total_mutations += 1
-            
+
             return new_genome
-        
+
         elif mutation_type == 'insert':
             # Insert a trait
-            new_traits = [
-                "[CanMove]", 
-                "[CanEat]", 
-                "[Color:Red]", 
-                "[Color:Blue]", 
-                "[Color:Yellow]",
-                "[Color:Purple]"
-            ]
-            trait = random.choice(new_traits)
+            trait = _INSERT_TRAITS[int(random.random() * len(_INSERT_TRAITS))]
             new_genome = genome + trait
-            
+
             logger.info(f"Insert mutation: '{genome}' -> '{new_genome}' (added '{trait}')")
-            
+
             # Record mutation in stats if available
             if self.stats:
                 self.stats.tick_mutations += 1
                 self.stats.total_mutations += 1
-            
+
             return new_genome
-        
+
         else:  # delete
             # Remove a trait
-            traits = self.trait_pattern.findall(genome)
+            traits = self._findall(genome)
             if len(traits) <= 1:  # Keep at least [Cell]
-                logger.debug("Delete mutation skipped - only one trait remaining (need to keep [Cell])")
+                if __debug__ and _DEBUG:
+                    logger.debug("Delete mutation skipped - only one trait remaining (need to keep [Cell])")
                 return genome
-                
+
             # Don't remove the Cell trait
             removable_traits = [t for t in traits if t != "Cell"]
             if not removable_traits:
-                logger.debug("Delete mutation skipped - no removable traits (only [Cell] present)")
+                if __debug__ and _DEBUG:
+                    logger.debug("Delete mutation skipped - no removable traits (only [Cell] present)")
                 return genome
-                
+
             remove = random.choice(removable_traits)
             new_genome = genome.replace(f"[{remove}]", "", 1)
-            
+
             logger.info(f"Delete mutation: '{genome}' -> '{new_genome}' (removed '[{remove}]')")
-            
+
             # Record mutation in stats if available
             if self.stats:
                 self.stats.tick_mutations += 1
                 self.stats.total_mutations += 1
-            
-            return new_genome
\ No newline at end of file
+
+            return new_genome
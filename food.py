@@ -1,39 +1,91 @@
 # food.py
 import numpy as np
 import logging
-from scipy.sparse import dok_matrix
 import random
+from scipy import ndimage
 from config import Config
 
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
 logger = logging.getLogger('food')
 
+# Cached debug-enabled flag, refreshed by Config.setup_logging. Hot methods
+# additionally test __debug__ so running with -O strips the logging branches
+# at bytecode-compile time.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+# Conway-style stencil for counting the 8 surrounding food cells
+_NEIGHBOR_KERNEL = np.ones((3, 3), dtype=np.int8)
+
+# Regeneration chance indexed by neighbor count (0-8); only 1-3 neighbors
+# can regenerate, with 3 getting the full rate
+_REGEN_CHANCES = np.zeros(9)
+_REGEN_CHANCES[1] = Config.FOOD_REGEN_RATE * 0.3  # Small chance for 1 neighbor
+_REGEN_CHANCES[2] = Config.FOOD_REGEN_RATE * 0.8  # Slightly lower for 2 neighbors
+_REGEN_CHANCES[3] = Config.FOOD_REGEN_RATE  # Full rate for 3 neighbors
+
+if _HAS_NUMBA:
+    @njit(cache=True, nogil=True)
+    def _regen_kernel(grid, xs, ys, chances):
+        """Fused neighbor-count + regeneration draw over the sampled probes.
+
+        Compiled to native code, so it skips the full-grid convolution the
+        NumPy fallback needs and only touches the probed neighborhoods.
+        """
+        hits = np.zeros(xs.shape[0], dtype=np.bool_)
+        for i in range(xs.shape[0]):
+            x, y = xs[i], ys[i]
+            if grid[x, y] != 0:
+                continue
+            neighbors = 0
+            for dx in range(-1, 2):
+                for dy in range(-1, 2):
+                    if grid[x + dx, y + dy] != 0:
+                        neighbors += 1
+            if np.random.random() < chances[neighbors]:
+                hits[i] = True
+        return hits
+
 class FoodSystem:
     def __init__(self, width, height):
         logger.info(f"Initializing food system for {width}x{height} world")
         
         self.width = width
         self.height = height
-        self.food_grid = dok_matrix((width, height), dtype=np.int8)
-        self.food_energy = {}
-        
+        # Dense grid where the value IS the food energy (0 = no food).
+        # Energies stay below 127 so int8 holds them, and folding energy
+        # into the grid removes the old (x, y) -> energy dict entirely
+        self.food_grid = np.zeros((width, height), dtype=np.int8)
+        # Maintained incrementally on spawn/eat so the status log and HUD
+        # don't pay a count_nonzero scan of the whole grid
+        self._count = 0
+
         logger.debug("Food system data structures initialized")
     
     def spawn_gaussian_cluster(self, cx, cy, spread, density):
         """Spawn food in gaussian distribution"""
         logger.info(f"Spawning Gaussian food cluster at ({cx}, {cy}) with spread={spread}, density={density}")
         
-        food_spawned = 0
         search_radius = spread * 2
-        
-        for x in range(max(0, cx-search_radius), min(self.width, cx+search_radius)):
-            for y in range(max(0, cy-search_radius), min(self.height, cy+search_radius)):
-                dist_sq = (x-cx)**2 + (y-cy)**2
-                prob = density * np.exp(-dist_sq / (2 * spread**2))
-                
-                if random.random() < prob:
-                    self.spawn_food(x, y, Config.FOOD_ENERGY)  # Use config value
-                    food_spawned += 1
-        
+        x0, x1 = max(0, cx - search_radius), min(self.width, cx + search_radius)
+        y0, y1 = max(0, cy - search_radius), min(self.height, cy + search_radius)
+
+        # Vectorized: one broadcasted gaussian + one Bernoulli draw over the
+        # whole window instead of a Python loop per candidate position
+        xs = np.arange(x0, x1)
+        ys = np.arange(y0, y1)
+        dist_sq = (xs[:, None] - cx) ** 2 + (ys[None, :] - cy) ** 2
+        prob = density * np.exp(-dist_sq / (2 * spread ** 2))
+        mask = np.random.random(prob.shape) < prob
+
+        xs_hit, ys_hit = np.nonzero(mask)
+        self._spawn_bulk(xs_hit + x0, ys_hit + y0, Config.FOOD_ENERGY)  # Use config value
+        food_spawned = int(xs_hit.size)
+
         logger.info(f"Gaussian cluster spawning complete: {food_spawned} food items created")
     
     def spawn_food(self, x, y, energy):
@@ -42,83 +94,123 @@ class FoodSystem:
             logger.warning(f"Attempted to spawn food outside world bounds at ({x}, {y})")
             return
             
-        if (x, y) in self.food_energy:
-            logger.debug(f"Overwriting existing food at ({x}, {y}) - old energy: {self.food_energy[(x, y)]}, new energy: {energy}")
-        else:
-            logger.debug(f"Spawning food at ({x}, {y}) with energy {energy}")
-            
-        self.food_grid[x, y] = 1
-        self.food_energy[(x, y)] = energy
-    
+        if __debug__ and _DEBUG:
+            old_energy = self.food_grid[x, y]
+            if old_energy:
+                logger.debug("Overwriting existing food at (%d, %d) - old energy: %d, new energy: %d",
+                             x, y, old_energy, energy)
+            else:
+                logger.debug("Spawning food at (%d, %d) with energy %d", x, y, energy)
+
+        if self.food_grid[x, y] == 0:
+            self._count += 1
+        self.food_grid[x, y] = energy
+
+    def _spawn_bulk(self, xs, ys, energy):
+        """Spawn food at many positions with a single fancy-indexed write.
+
+        Callers are responsible for in-bounds coordinates; this skips the
+        per-position bounds check and logging that spawn_food performs.
+        """
+        # Unique flat indices of previously-empty targets keep the count
+        # exact even if the caller passed duplicate coordinates
+        empty = self.food_grid[xs, ys] == 0
+        if empty.any():
+            flat = np.asarray(xs, dtype=np.int64) * self.height + np.asarray(ys, dtype=np.int64)
+            self._count += int(np.unique(flat[empty]).size)
+        self.food_grid[xs, ys] = energy
+
     def eat_food(self, x, y):
         """Try to eat food at position"""
-        if (x, y) in self.food_energy:
-            energy = self.food_energy[(x, y)]
-            del self.food_energy[(x, y)]
+        energy = int(self.food_grid[x, y])
+        if energy:
             self.food_grid[x, y] = 0
-            
-            logger.debug(f"Food eaten at ({x}, {y}) - energy gained: {energy}")
+            self._count -= 1
+
+            if __debug__ and _DEBUG:
+                logger.debug("Food eaten at (%d, %d) - energy gained: %d", x, y, energy)
             return energy
-        
-        logger.debug(f"No food found at ({x}, {y}) to eat")
+
+        if __debug__ and _DEBUG:
+            logger.debug("No food found at (%d, %d) to eat", x, y)
         return 0
     
     def regenerate(self):
         """Conway-inspired food regeneration with enhanced rate"""
-        logger.debug("Starting food regeneration cycle")
-        
-        new_food = []
-        attempts = 0
+        if __debug__ and _DEBUG:
+            logger.debug("Starting food regeneration cycle")
         
         # ENHANCED: Check more cells for regeneration
-        check_count = min(200, max(100, len(self.food_energy) // 2))  # Scale with existing food
-        
-        for _ in range(check_count):
-            attempts += 1
-            x = random.randint(1, self.width-2)
-            y = random.randint(1, self.height-2)
-            
-            if self.food_grid[x, y] == 0:
-                # Count neighbors
-                neighbors = 0
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        if dx == 0 and dy == 0:
-                            continue
-                        if self.food_grid[x+dx, y+dy] == 1:
-                            neighbors += 1
-                
-                # ENHANCED: More favorable regeneration rules
-                regeneration_chance = 0
-                if neighbors == 2:
-                    regeneration_chance = Config.FOOD_REGEN_RATE * 0.8  # Slightly lower for 2 neighbors
-                elif neighbors == 3:
-                    regeneration_chance = Config.FOOD_REGEN_RATE  # Full rate for 3 neighbors
-                elif neighbors == 1:
-                    regeneration_chance = Config.FOOD_REGEN_RATE * 0.3  # Small chance for 1 neighbor
-                
-                if regeneration_chance > 0 and random.random() < regeneration_chance:
-                    new_food.append((x, y))
-                    logger.debug(f"Food regeneration candidate at ({x}, {y}) with {neighbors} neighbors")
-        
-        # Spawn new food
-        regenerated_count = 0
-        for x, y in new_food:
-            self.spawn_food(x, y, Config.FOOD_ENERGY)
-            regenerated_count += 1
+        check_count = min(200, max(100, self.food_count // 2))  # Scale with existing food
+        attempts = check_count
+
+        xs = np.random.randint(1, self.width - 1, check_count, dtype=np.int32)
+        ys = np.random.randint(1, self.height - 1, check_count, dtype=np.int32)
+
+        if _HAS_NUMBA:
+            # Jitted kernel only touches the probed 3x3 neighborhoods
+            hits = _regen_kernel(self.food_grid, xs, ys, _REGEN_CHANCES)
+        else:
+            # Neighbor counts for the whole grid in one C-level stencil pass,
+            # then all regeneration chances rolled in a single draw
+            # ENHANCED: More favorable regeneration rules
+            # The grid holds packed energy values, so convolve a 0/1
+            # presence mask to get neighbor *counts*, not energy sums
+            present = (self.food_grid != 0).astype(np.int8)
+            neighbors = ndimage.convolve(present, _NEIGHBOR_KERNEL, mode='constant') - present
+            chances = _REGEN_CHANCES[neighbors[xs, ys]]
+            hits = (self.food_grid[xs, ys] == 0) & (np.random.random(check_count) < chances)
+
+        # Spawn new food in one batched write
+        spawn_xs, spawn_ys = xs[hits], ys[hits]
+        if __debug__ and _DEBUG:
+            for x, y in zip(spawn_xs, spawn_ys):
+                neighbors = np.count_nonzero(self.food_grid[x-1:x+2, y-1:y+2])
+                logger.debug("Food regeneration candidate at (%d, %d) with %d neighbors", x, y, neighbors)
+        self._spawn_bulk(spawn_xs, spawn_ys, Config.FOOD_ENERGY)
+        regenerated_count = int(spawn_xs.size)
         
         if regenerated_count > 0:
             logger.info(f"Food regeneration complete: {regenerated_count} new food items from {attempts} attempts")
-        else:
-            logger.debug(f"No food regenerated this cycle (checked {attempts} locations)")
+        elif __debug__ and _DEBUG:
+            logger.debug("No food regenerated this cycle (checked %d locations)", attempts)
     
+    @property
+    def food_count(self):
+        """Number of food items currently on the grid"""
+        return self._count
+
+    def total_energy(self):
+        """Total energy of all food on the grid"""
+        return int(self.food_grid.sum(dtype=np.int64))
+
+    def food_items(self):
+        """Iterate (x, y, energy) for every food item"""
+        for x, y in np.argwhere(self.food_grid):
+            yield int(x), int(y), int(self.food_grid[x, y])
+
+    def food_coords_in(self, x1, y1, x2, y2):
+        """Coordinate arrays of food inside an inclusive world-space rect.
+
+        Scans only the viewport slice of the grid, so cost tracks the
+        visible area rather than the whole world or total food count.
+        """
+        x1 = max(int(x1), 0)
+        y1 = max(int(y1), 0)
+        x2 = min(int(x2), self.width - 1)
+        y2 = min(int(y2), self.height - 1)
+        if x1 > x2 or y1 > y2:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        xs, ys = np.nonzero(self.food_grid[x1:x2 + 1, y1:y2 + 1])
+        return xs + x1, ys + y1
+
     def to_dict(self):
         """Convert to JSON-serializable format"""
         logger.debug("Converting food system to dictionary")
         
         result = {
-            "food": [(int(x), int(y), self.food_energy.get((x,y), Config.FOOD_ENERGY)) 
-                    for x, y in zip(*self.food_grid.nonzero())]
+            "food": [(x, y, energy) for x, y, energy in self.food_items()]
         }
         
         logger.debug(f"Food system serialization complete: {len(result['food'])} food items")
@@ -2,7 +2,14 @@
 import pygame
 import json
 import sys
+
+try:
+    import orjson  # Optional: much faster world serialization when installed
+except ImportError:
+    orjson = None
 import logging
+import threading
+import time
 from datetime import datetime
 from world import World
 from renderer import Renderer
@@ -13,6 +20,34 @@ from config import Config
 Config.setup_logging()
 logger = logging.getLogger('main')
 
+class _WorldSnapshot:
+    """Copy of the world state one frame reads.
+
+    Captured under the world lock as a handful of array memcpys, then
+    handed to the renderer in place of the live world, so culling,
+    shading, blitting and the (possibly vsync-blocked) display flip all
+    run with the lock released: a slow tick no longer stalls drawing and
+    a slow flip no longer stalls the tick. Duck-types exactly the
+    attributes render_world touches.
+    """
+
+    class _StoreView:
+        __slots__ = ('x', 'y', 'energy', 'organism_id', 'alive')
+
+    class _FoodView:
+        __slots__ = ('_xs', '_ys', 'food_count')
+
+        def food_coords_in(self, x1, y1, x2, y2):
+            # The bounds were captured from the same camera state that
+            # renders the frame, so the precomputed coords already match
+            return self._xs, self._ys
+
+    __slots__ = ('tick_counter', 'cell_store', 'organism_color_ids',
+                 'food_system', 'cells', 'organisms', '_wall_xs', '_wall_ys')
+
+    def wall_coords(self):
+        return self._wall_xs, self._wall_ys
+
 class Simulation:
     def __init__(self, world_file=None):
         logger.info("Initializing Cellular Evolution Simulator")
@@ -20,15 +55,25 @@ class Simulation:
         
         try:
             pygame.init()
+            # Only queue the event types handle_events actually dispatches;
+            # everything else is dropped at the SDL layer instead of being
+            # constructed and skipped in Python every frame
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed([
+                pygame.QUIT, pygame.KEYDOWN,
+                pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION,
+            ])
             logger.debug("Pygame initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Pygame: {e}")
             raise
         
-        self.clock = pygame.time.Clock()
         self.running = True
         self.paused = False
         self.tick = 0
+        # Guards world/stats state shared between the simulation thread and
+        # the render/event main thread
+        self.world_lock = threading.Lock()
         logger.debug("Simulation state variables initialized")
         
         # Initialize statistics tracker
@@ -104,36 +149,117 @@ class Simulation:
         total_spawned = mover_count + stationary_count + predator_count
         logger.info(f"Initial organism spawn complete: {total_spawned} total organisms")
     
+    def _simulation_loop(self):
+        """Worker-thread loop: advance the world independently of rendering.
+
+        SDL requires the display to stay on the main thread, so the world
+        update runs here and the main thread only handles events and
+        drawing. The world lock is held for the tick and for each frame's
+        input snapshot, never across drawing or the display flip, so the
+        two threads only serialize on the snapshot copy.
+        """
+        logger.info("Simulation thread started")
+
+        tick_interval = 1.0 / Config.SIM_TICK_RATE
+        next_tick = time.perf_counter()
+
+        while self.running:
+            try:
+                if self.paused:
+                    time.sleep(0.01)
+                    next_tick = time.perf_counter()
+                    continue
+
+                with self.world_lock:
+                    self.world.update()
+                    self.tick += 1
+
+                # Periodic status logging. All three counts are O(1) reads
+                # (dict lengths and the incrementally maintained food count)
+                # and %-formatting defers the string build to the handler
+                if self.tick % 100 == 0:
+                    logger.info("Tick %d: %d cells, %d organisms, %d food",
+                                self.tick, len(self.world.cells),
+                                len(self.world.organisms),
+                                self.world.food_system.food_count)
+
+                # Fixed-timestep pacing; if we fell behind, resync instead
+                # of bursting to catch up
+                next_tick += tick_interval
+                now = time.perf_counter()
+                if next_tick < now:
+                    next_tick = now
+                while time.perf_counter() < next_tick and self.running:
+                    time.sleep(0)
+
+            except Exception as e:
+                logger.error(f"Error in simulation thread at tick {self.tick}: {e}")
+                logger.debug("Exception details:", exc_info=True)
+
+        logger.info("Simulation thread stopped")
+
+    def _snapshot_world(self):
+        """Capture one frame's render inputs under the world lock"""
+        snap = _WorldSnapshot()
+        store_view = _WorldSnapshot._StoreView()
+        food_view = _WorldSnapshot._FoodView()
+        x1, y1, x2, y2 = self.renderer.camera.get_visible_bounds()
+
+        with self.world_lock:
+            world = self.world
+            store = world.cell_store
+            store_view.x = store.x.copy()
+            store_view.y = store.y.copy()
+            store_view.energy = store.energy.copy()
+            store_view.organism_id = store.organism_id.copy()
+            store_view.alive = store.alive.copy()
+
+            snap.tick_counter = world.tick_counter
+            snap.organism_color_ids = world.organism_color_ids.copy()
+            food_view._xs, food_view._ys = world.food_system.food_coords_in(x1, y1, x2, y2)
+            food_view.food_count = world.food_system.food_count
+            # Walls never change after setup/load, so references suffice
+            snap._wall_xs, snap._wall_ys = world.wall_coords()
+
+        # The HUD only reads len() of these dicts, which is atomic under
+        # the GIL, so live references are safe outside the lock
+        snap.cells = world.cells
+        snap.organisms = world.organisms
+        snap.cell_store = store_view
+        snap.food_system = food_view
+        return snap
+
     def run(self):
-        logger.info("Starting main simulation loop")
+        logger.info("Starting main loop (render/events) and simulation thread")
         frame_count = 0
-        
+
+        sim_thread = threading.Thread(target=self._simulation_loop,
+                                      name="simulation", daemon=True)
+        sim_thread.start()
+
+        # pygame's Clock has ~10ms granularity; pace frames with
+        # perf_counter and keep servicing events while we wait
+        frame_interval = 1.0 / Config.FPS
+        next_frame = time.perf_counter()
+
         while self.running:
             try:
                 self.handle_events()
-                
-                if not self.paused:
-                    self.world.update()
-                    self.tick += 1
-                    
-                    # Periodic status logging
-                    if self.tick % 100 == 0:
-                        cell_count = len(self.world.cells)
-                        org_count = len(self.world.organisms)
-                        food_count = len(self.world.food_system.food_energy)
-                        
-                        logger.info(f"Tick {self.tick}: {cell_count} cells, {org_count} organisms, {food_count} food")
-                        
-                        # Debug log for performance monitoring
-                        if self.tick % 1000 == 0:
-                            logger.debug(f"Performance check at tick {self.tick}: "
-                                       f"Average {frame_count/(self.tick/100):.1f} FPS over last period")
-                
-                # Always render, whether paused or not
-                self.renderer.render(self.world, self.stats)
-                self.clock.tick(Config.FPS)
+
+                # Always render the latest completed tick, paused or not.
+                # Only the input snapshot holds the world lock; the draw
+                # and the flip run against the copy with the lock released
+                self.renderer.render(self._snapshot_world(), self.stats)
                 frame_count += 1
-                
+
+                next_frame += frame_interval
+                now = time.perf_counter()
+                if next_frame < now:
+                    next_frame = now
+                while time.perf_counter() < next_frame and self.running:
+                    self.handle_events()
+                    time.sleep(0)
+
             except Exception as e:
                 logger.error(f"Error in main loop at tick {self.tick}: {e}")
                 logger.debug("Exception details:", exc_info=True)
@@ -141,7 +267,8 @@ class Simulation:
                 if isinstance(e, (KeyboardInterrupt, SystemExit)):
                     logger.info("Received shutdown signal")
                     break
-        
+
+        sim_thread.join(timeout=2.0)
         logger.info(f"Simulation ended after {self.tick} ticks and {frame_count} frames")
         
         # Log final statistics summary
@@ -159,7 +286,10 @@ class Simulation:
         logger.debug("Pygame shut down cleanly")
     
     def handle_events(self):
-        for event in pygame.event.get():
+        # Typed polls: keyboard/quit first (rare), then the mouse types
+        # that can flood the queue, so each event only walks the branches
+        # relevant to its group
+        for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
             if event.type == pygame.QUIT:
                 logger.info("Quit event received")
                 self.running = False
@@ -192,7 +322,9 @@ class Simulation:
                     old_zoom = self.renderer.camera.zoom
                     self.renderer.camera.zoom /= 1.2
                     logger.debug(f"Zoom out: {old_zoom:.2f} -> {self.renderer.camera.zoom:.2f}")
-            elif event.type == pygame.MOUSEBUTTONDOWN:
+        for event in pygame.event.get((pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                                       pygame.MOUSEMOTION)):
+            if event.type == pygame.MOUSEBUTTONDOWN:
                 # Don't process mouse events in stats view
                 if not self.renderer.show_stats:
                     if event.button == 1:  # Left click
@@ -242,7 +374,8 @@ class Simulation:
         
         try:
             logger.info(f"Saving world to {filename}")
-            world_data = self.world.to_dict()
+            with self.world_lock:
+                world_data = self.world.to_dict()
             
             # Add statistics snapshot to saved world
             world_data['stats_snapshot'] = {
@@ -251,8 +384,16 @@ class Simulation:
                 'notable_events': list(self.stats.notable_events)
             }
             
-            with open(filename, 'w') as f:
-                json.dump(world_data, f, indent=2)
+            # Compact output: pretty-printing ballooned save time and file
+            # size once worlds reached tens of thousands of entries
+            if orjson is not None:
+                # OPT_SERIALIZE_NUMPY: the stats summary carries numpy
+                # scalars (np.mean results), which orjson otherwise rejects
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(world_data, option=orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(world_data, f, separators=(',', ':'))
             
             logger.info(f"World saved successfully: {len(world_data['organisms'])} organisms, "
                        f"{len(world_data['food']['food'])} food items, "
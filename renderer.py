@@ -5,8 +5,54 @@ import logging
 from typing import Optional
 import math
 
+from dna import COLOR_NAMES
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
 logger = logging.getLogger('renderer')
 
+# Cached debug-enabled flag, same pattern as cell/dna/food: hot render
+# paths test a module global instead of calling isEnabledFor per frame.
+# Re-evaluated by Config.setup_logging once levels are configured.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+if _HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _cull_and_project(xs, ys, energy, org_id, alive,
+                          x1, y1, x2, y2, camx, camy, zoom, cx, cy):
+        """Single native pass: cull + project + shading-table prep.
+
+        Returns the number of visible slots plus parallel slot, screen
+        coordinate, clamped energy bucket, and organism-id arrays (valid
+        up to that count). Fuses what the NumPy fallback does in several
+        mask, index, project, and clip passes.
+        """
+        n = xs.size
+        slots = np.empty(n, dtype=np.int64)
+        sxs = np.empty(n, dtype=np.int32)
+        sys_ = np.empty(n, dtype=np.int32)
+        buckets = np.empty(n, dtype=np.int32)
+        org_ids = np.empty(n, dtype=np.int32)
+        count = 0
+        for i in range(n):
+            if alive[i] and x1 <= xs[i] <= x2 and y1 <= ys[i] <= y2:
+                slots[count] = i
+                sxs[count] = np.int32((xs[i] - camx) * zoom + cx)
+                sys_[count] = np.int32((ys[i] - camy) * zoom + cy)
+                e = energy[i]
+                if e < 0:
+                    e = 0
+                elif e > 200:
+                    e = 200
+                buckets[count] = e
+                org_ids[count] = org_id[i]
+                count += 1
+        return count, slots, sxs, sys_, buckets, org_ids
+
 class Camera:
     def __init__(self, screen_width, screen_height):
         logger.debug(f"Initializing camera for {screen_width}x{screen_height} screen")
@@ -18,7 +64,12 @@ class Camera:
         self.screen_height = screen_height
         self.dragging = False
         self.drag_start = (0, 0)
-        
+
+        # Memoized visible bounds, keyed on the camera state that feeds
+        # them; panning/zooming invalidates the key naturally
+        self._bounds_key = None
+        self._bounds_cache = None
+
         logger.debug("Camera initialized at origin with zoom 1.0")
     
     def world_to_screen(self, wx, wy):
@@ -26,25 +77,51 @@ class Camera:
         sx = (wx - self.x) * self.zoom + self.screen_width // 2
         sy = (wy - self.y) * self.zoom + self.screen_height // 2
         return int(sx), int(sy)
+
+    def world_to_screen_batch(self, xs, ys):
+        """Vectorized world_to_screen over coordinate arrays.
+
+        The transform is applied as a precomputed affine sx = xs*z + ox,
+        folding the camera offset into a scalar so each axis costs one
+        multiply and one add over the array; returns int32 arrays.
+        """
+        z = self.zoom
+        ox = self.screen_width // 2 - self.x * z
+        oy = self.screen_height // 2 - self.y * z
+        sxs = (xs * z + ox).astype(np.int32)
+        sys_ = (ys * z + oy).astype(np.int32)
+        return sxs, sys_
     
     def get_visible_bounds(self):
-        """Get world bounds visible on screen"""
-        half_w = self.screen_width // (2 * self.zoom)
-        half_h = self.screen_height // (2 * self.zoom)
-        bounds = (
-            int(self.x - half_w), int(self.y - half_h),
-            int(self.x + half_w), int(self.y + half_h)
-        )
-        
-        logger.debug(f"Camera visible bounds: ({bounds[0]}, {bounds[1]}) to ({bounds[2]}, {bounds[3]})")
-        return bounds
+        """Get world bounds visible on screen, as floats.
+
+        The bounds only feed inequality tests (NumPy masks and the culling
+        kernel), where floats compare just as fast as ints and avoid the
+        truncation that shaved a fraction of a unit off each edge.
+        """
+        # No logging here - this runs once per frame on the hot path
+        key = (self.x, self.y, self.zoom, self.screen_width, self.screen_height)
+        if key != self._bounds_key:
+            half_w = self.screen_width / (2 * self.zoom)
+            half_h = self.screen_height / (2 * self.zoom)
+            self._bounds_key = key
+            self._bounds_cache = (
+                self.x - half_w, self.y - half_h,
+                self.x + half_w, self.y + half_h
+            )
+        return self._bounds_cache
 
 class Renderer:
     def __init__(self, width, height):
         logger.info(f"Initializing renderer with {width}x{height} display")
         
         try:
-            self.screen = pygame.display.set_mode((width, height))
+            # DOUBLEBUF lets SDL flip buffers instead of copying the whole
+            # frame on display.flip(). The experimental pygame._sdl2 texture
+            # renderer would go further (GPU rects) but is a private API and
+            # incompatible with the surfarray fast path, so we stay on
+            # surfaces and make the software blits as cheap as possible.
+            self.screen = pygame.display.set_mode((width, height), pygame.DOUBLEBUF)
             pygame.display.set_caption("Cellular Evolution")
             logger.debug("Pygame display initialized successfully")
         except Exception as e:
@@ -86,9 +163,102 @@ class Renderer:
             "Danger": (255, 50, 50)
         }
         
+        # Brightness-scaled palette: _color_lut[color_id, energy] is the
+        # final uint8 RGB for a cell of that color with that (clamped)
+        # energy, so the per-cell cost is one table lookup instead of a
+        # min() plus three multiplies and a tuple build
+        self._color_ids = {name: i for i, name in enumerate(self.COLORS)}
+        # Palette-id (from dna.COLOR_NAMES) -> row in the color table, so
+        # organism colors resolve with integer gathers instead of per-cell
+        # string/dict lookups
+        self._dna_color_rows = np.array(
+            [self._color_ids.get(name, self._color_ids["Green"]) for name in COLOR_NAMES],
+            dtype=np.intp)
+        self._color_lut = np.zeros((len(self.COLORS), 201, 3), dtype=np.uint8)
+        for name, rgb in self.COLORS.items():
+            energies = np.arange(201) / 200.0
+            self._color_lut[self._color_ids[name]] = (
+                np.array(rgb)[None, :] * energies[:, None]).astype(np.uint8)
+
+        # Small solid surfaces cached by (color, size) so each frame issues
+        # a few batched blits() calls instead of thousands of draw.rect calls
+        self._sprite_cache = {}
+
+        # Reused pixel buffer for the low-zoom rasterized render path
+        self._pixel_buffer = None
+
+        # Scratch arrays for shifted block coordinates, grown on demand so
+        # _plot_blocks doesn't allocate fresh arrays per offset per frame
+        self._scratch_x = np.empty(0, dtype=np.int32)
+        self._scratch_y = np.empty(0, dtype=np.int32)
+
+        # Stats view rendered once per stats tick and replayed from a
+        # cached surface on the frames in between
+        self._stats_surface = None
+        self._stats_surface_tick = -1
+
+        # World view cached the same way: when neither the simulation nor
+        # the camera changed since the last frame (e.g. while paused), the
+        # finished frame is replayed instead of re-culled and redrawn
+        self._world_frame = None
+        self._world_frame_key = None
+
+        # Font renders cached by (font, text, color): SDL_ttf allocates a
+        # fresh surface per render call, but most HUD strings repeat from
+        # frame to frame (controls are static, counts change once per tick)
+        self._text_cache = {}
+
         logger.debug(f"Color palette initialized with {len(self.COLORS)} colors")
         logger.info("Renderer initialization complete")
     
+    # Changing count strings would otherwise grow the text cache without
+    # bound over a long run; FIFO eviction keeps it at steady state
+    _TEXT_CACHE_SIZE = 64
+
+    def _render_text(self, font, text, color):
+        """Render text through the surface cache"""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= self._TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+            surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+        return surf
+
+    def _blit_batch(self, seq):
+        """Issue one batched blit call, preferring fblits where available.
+
+        pygame-ce's fblits skips the per-pair special-flag handling that
+        blits does, so it's the cheaper C loop when the build ships it.
+        """
+        fblits = getattr(self.screen, 'fblits', None)
+        if fblits is not None:
+            fblits(seq)
+        else:
+            self.screen.blits(seq, doreturn=False)
+
+    # Energy shading yields up to 201 distinct RGB tuples per organism
+    # color, and every zoom level visited adds a new size - unbounded,
+    # that grows for the whole session. FIFO eviction like the text
+    # cache, sized above a frame's working set so steady zoom levels
+    # never thrash
+    _SPRITE_CACHE_SIZE = 2048
+
+    def _get_sprite(self, color, size):
+        """Get (or lazily build) the cached solid sprite for a color/size"""
+        key = (color, size)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            if len(self._sprite_cache) >= self._SPRITE_CACHE_SIZE:
+                del self._sprite_cache[next(iter(self._sprite_cache))]
+            # convert() matches the display pixel format so each blit is a
+            # straight memory copy with no per-pixel conversion
+            sprite = pygame.Surface((size, size)).convert()
+            sprite.fill(color)
+            self._sprite_cache[key] = sprite
+        return sprite
+
     def toggle_fullscreen(self):
         """Toggle fullscreen mode"""
         self.fullscreen = not self.fullscreen
@@ -96,14 +266,16 @@ class Renderer:
         if self.fullscreen:
             # Get current display info
             info = pygame.display.Info()
-            self.screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
+            self.screen = pygame.display.set_mode((info.current_w, info.current_h),
+                                                  pygame.FULLSCREEN | pygame.DOUBLEBUF)
             self.screen_width = info.current_w
             self.screen_height = info.current_h
             logger.info(f"Switched to fullscreen mode: {self.screen_width}x{self.screen_height}")
         else:
             # Return to windowed mode
             from config import Config
-            self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+            self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT),
+                                                  pygame.DOUBLEBUF)
             self.screen_width = Config.SCREEN_WIDTH
             self.screen_height = Config.SCREEN_HEIGHT
             logger.info(f"Switched to windowed mode: {self.screen_width}x{self.screen_height}")
@@ -122,88 +294,194 @@ class Renderer:
     def render_world(self, world):
         """Render the simulation world"""
         try:
-            # Clear screen
-            self.screen.fill(self.COLORS["Background"])
-            
+            # Dirty-frame short-circuit: tick_counter only advances when
+            # the world updates, so an unchanged (tick, camera, size) key
+            # means the frame would be pixel-identical to the last one
+            cam = self.camera
+            frame_key = (world.tick_counter, cam.x, cam.y, cam.zoom,
+                         self.screen.get_size())
+            if frame_key == self._world_frame_key and self._world_frame is not None:
+                self.screen.blit(self._world_frame, (0, 0))
+                pygame.display.flip()
+                return
+
             # Get visible bounds
             x1, y1, x2, y2 = self.camera.get_visible_bounds()
-            
-            # Count rendered objects for debug logging
-            food_rendered = 0
-            walls_rendered = 0
-            cells_rendered = 0
-            
-            # Render food
-            for (fx, fy), energy in world.food_system.food_energy.items():
-                if x1 <= fx <= x2 and y1 <= fy <= y2:
-                    sx, sy = self.camera.world_to_screen(fx, fy)
-                    size = max(2, int(3 * self.camera.zoom))
-                    
-                    try:
-                        pygame.draw.rect(self.screen, self.COLORS["Food"],
-                                       (sx, sy, size, size))
-                        food_rendered += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to render food at ({fx}, {fy}): {e}")
-            
-            # Render walls
-            for wx, wy in zip(*world.walls.nonzero()):
-                if x1 <= wx <= x2 and y1 <= wy <= y2:
-                    sx, sy = self.camera.world_to_screen(wx, wy)
-                    size = max(1, int(self.camera.zoom))
-                    
-                    try:
-                        pygame.draw.rect(self.screen, self.COLORS["Wall"],
-                                       (sx, sy, size, size))
-                        walls_rendered += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to render wall at ({wx}, {wy}): {e}")
-            
-            # Render cells
-            for cell in world.cells.values():
-                if x1 <= cell.x <= x2 and y1 <= cell.y <= y2:
-                    organism = world.organisms.get(cell.organism_id)
-                    if organism:
-                        color = self.COLORS.get(organism.color, self.COLORS["Green"])
-                        sx, sy = self.camera.world_to_screen(cell.x, cell.y)
-                        size = max(2, int(4 * self.camera.zoom))
-                        
-                        # Brighter if more energy
-                        brightness = min(1.0, cell.energy / 200)
-                        color = tuple(int(c * brightness) for c in color)
-                        
-                        try:
-                            pygame.draw.rect(self.screen, color,
-                                           (sx, sy, size, size))
-                            cells_rendered += 1
-                        except Exception as e:
-                            logger.warning(f"Failed to render cell {cell.id} at ({cell.x}, {cell.y}): {e}")
-                    else:
-                        logger.warning(f"Cell {cell.id} has invalid organism_id {cell.organism_id}")
-            
+
+            # At low zoom every object is only a couple of pixels, so
+            # rasterizing into a pixel array and blitting once beats
+            # issuing thousands of tiny blits
+            if self.camera.zoom <= 1.0:
+                food_rendered, walls_rendered, cells_rendered = \
+                    self._render_world_pixels(world, x1, y1, x2, y2)
+            else:
+                food_rendered, walls_rendered, cells_rendered = \
+                    self._render_world_sprites(world, x1, y1, x2, y2)
+
             # Render HUD
             self._render_hud(world)
-            
+
+            self._world_frame = self.screen.copy()
+            self._world_frame_key = frame_key
+
             # Update display
             pygame.display.flip()
-            
-            # Debug logging for render counts (only log periodically to avoid spam)
-            total_rendered = food_rendered + walls_rendered + cells_rendered
-            if total_rendered > 0:
-                logger.debug(f"Rendered {cells_rendered} cells, {food_rendered} food, "
-                           f"{walls_rendered} walls in visible area")
-            
+
+            # Debug logging for render counts, guarded so the format args
+            # aren't evaluated every frame when debug logging is off (and
+            # compiled out entirely under python -O)
+            if __debug__ and _DEBUG:
+                total_rendered = food_rendered + walls_rendered + cells_rendered
+                if total_rendered > 0:
+                    logger.debug("Rendered %d cells, %d food, %d walls in visible area",
+                                 cells_rendered, food_rendered, walls_rendered)
+
         except Exception as e:
             logger.error(f"Critical error during world rendering: {e}")
             logger.debug("Render error details:", exc_info=True)
             raise
-    
+
+    def _visible_cell_slots(self, world, x1, y1, x2, y2):
+        """Cull the cell store against the viewport.
+
+        Returns (slots, screen_xs, screen_ys, energy_buckets, organism_ids)
+        for all visible live cells, computed in vectorized NumPy ops.
+        """
+        store = world.cell_store
+        cxs, cys = store.x, store.y
+        if _HAS_NUMBA:
+            cam = self.camera
+            count, slots, sxs, sys_, energy_buckets, org_ids = _cull_and_project(
+                cxs, cys, store.energy, store.organism_id, store.alive,
+                x1, y1, x2, y2,
+                cam.x, cam.y, cam.zoom, cam.screen_width // 2, cam.screen_height // 2)
+            return (slots[:count], sxs[:count], sys_[:count],
+                    energy_buckets[:count], org_ids[:count])
+
+        visible = store.alive & (cxs >= x1) & (cxs <= x2) & (cys >= y1) & (cys <= y2)
+        slots = np.nonzero(visible)[0]
+        sxs, sys_ = self.camera.world_to_screen_batch(cxs[slots], cys[slots])
+        # Brighter if more energy: bucket the clamped energies straight
+        # into the precomputed color table
+        energy_buckets = np.clip(store.energy[slots], 0, 200)
+        return slots, sxs, sys_, energy_buckets, store.organism_id[slots]
+
+    def _cell_color_ids(self, world, org_ids):
+        """Map organism ids to color-table rows in one vectorized gather.
+
+        The world mirrors each organism's palette id into a dense array at
+        spawn time, so no per-cell organism dict lookup is needed here.
+        """
+        return self._dna_color_rows[world.organism_color_ids[org_ids]]
+
+    def _plot_blocks(self, pix, sxs, sys_, colors, size):
+        """Write size x size pixel blocks at the given screen coordinates.
+
+        Blocks straddling a screen edge are dropped rather than clipped:
+        one validity mask up front replaces size^2 per-offset masks, and
+        at 1-2 pixel block sizes the difference is a single-pixel sliver
+        on the border.
+        """
+        valid = ((sxs >= 0) & (sxs < self.screen_width - size + 1) &
+                 (sys_ >= 0) & (sys_ < self.screen_height - size + 1))
+        xs = sxs[valid]
+        ys = sys_[valid]
+        if colors.ndim > 1:
+            colors = colors[valid]
+
+        if self._scratch_x.size < xs.size:
+            self._scratch_x = np.empty(xs.size * 2, dtype=np.int32)
+            self._scratch_y = np.empty(xs.size * 2, dtype=np.int32)
+        shifted_x = self._scratch_x[:xs.size]
+        shifted_y = self._scratch_y[:xs.size]
+
+        for dx in range(size):
+            np.add(xs, dx, out=shifted_x)
+            for dy in range(size):
+                np.add(ys, dy, out=shifted_y)
+                pix[shifted_x, shifted_y] = colors
+
+    def _render_world_pixels(self, world, x1, y1, x2, y2):
+        """Low-zoom fast path: rasterize into a pixel buffer, blit once"""
+        if (self._pixel_buffer is None or
+                self._pixel_buffer.shape[:2] != (self.screen_width, self.screen_height)):
+            self._pixel_buffer = np.empty((self.screen_width, self.screen_height, 3), dtype=np.uint8)
+        pix = self._pixel_buffer
+        pix[:] = self.COLORS["Background"]
+
+        # Food: only the viewport slice of the grid is scanned
+        fxs, fys = world.food_system.food_coords_in(x1, y1, x2, y2)
+        food_sxs, food_sys = self.camera.world_to_screen_batch(fxs, fys)
+        self._plot_blocks(pix, food_sxs, food_sys,
+                          np.array(self.COLORS["Food"], dtype=np.uint8), 2)
+
+        # Walls
+        wxs, wys = world.wall_coords()
+        visible = (wxs >= x1) & (wxs <= x2) & (wys >= y1) & (wys <= y2)
+        wall_sxs, wall_sys = self.camera.world_to_screen_batch(wxs[visible], wys[visible])
+        self._plot_blocks(pix, wall_sxs, wall_sys,
+                          np.array(self.COLORS["Wall"], dtype=np.uint8), 1)
+
+        # Cells, shaded through the color table in one bulk index
+        slots, cell_sxs, cell_sys, energy_buckets, org_ids = \
+            self._visible_cell_slots(world, x1, y1, x2, y2)
+        color_ids = self._cell_color_ids(world, org_ids)
+        colors = self._color_lut[color_ids, energy_buckets]
+        self._plot_blocks(pix, cell_sxs, cell_sys, colors, 2)
+
+        pygame.surfarray.blit_array(self.screen, pix)
+        return int(food_sxs.size), int(wall_sxs.size), int(slots.size)
+
+    def _render_world_sprites(self, world, x1, y1, x2, y2):
+        """Sprite path for zoom > 1, batched into blits() calls"""
+        # Clear screen
+        self.screen.fill(self.COLORS["Background"])
+
+        # Render food: pull only the visible coords from the grid slice,
+        # then blit the shared sprite in one batched call
+        food_size = max(2, int(3 * self.camera.zoom))
+        food_sprite = self._get_sprite(self.COLORS["Food"], food_size)
+        fxs, fys = world.food_system.food_coords_in(x1, y1, x2, y2)
+        food_sxs, food_sys = self.camera.world_to_screen_batch(fxs, fys)
+        # tolist() yields plain ints, so building the blit list skips a
+        # NumPy scalar box/unbox per coordinate
+        food_blits = [(food_sprite, pos)
+                      for pos in zip(food_sxs.tolist(), food_sys.tolist())]
+        self._blit_batch(food_blits)
+
+        # Render walls: cull the cached coordinate arrays and project the
+        # visible subset to screen space in vectorized NumPy ops
+        wxs, wys = world.wall_coords()
+        visible = (wxs >= x1) & (wxs <= x2) & (wys >= y1) & (wys <= y2)
+        vxs, vys = wxs[visible], wys[visible]
+        sxs, sys_ = self.camera.world_to_screen_batch(vxs, vys)
+        wall_size = max(1, int(self.camera.zoom))
+        wall_sprite = self._get_sprite(self.COLORS["Wall"], wall_size)
+        self._blit_batch([(wall_sprite, pos) for pos in zip(sxs.tolist(), sys_.tolist())])
+
+        # Render cells straight from the SoA store: cull, project, and
+        # shade with NumPy, then loop only over visible slots
+        slots, cell_sxs, cell_sys, energy_buckets, org_ids = \
+            self._visible_cell_slots(world, x1, y1, x2, y2)
+        color_ids = self._cell_color_ids(world, org_ids)
+
+        cell_size = max(2, int(4 * self.camera.zoom))
+        # One bulk LUT gather produces every shaded color; the Python loop
+        # only pairs sprites with positions
+        colors = self._color_lut[color_ids, energy_buckets].tolist()
+        cell_blits = [(self._get_sprite(tuple(color), cell_size), pos)
+                      for color, pos in zip(colors,
+                                            zip(cell_sxs.tolist(), cell_sys.tolist()))]
+        self._blit_batch(cell_blits)
+
+        return len(food_blits), int(vxs.size), len(cell_blits)
+
     def _render_hud(self, world):
         """Render the heads-up display with controls"""
         stats = [
             f"Cells: {len(world.cells)}",
             f"Organisms: {len(world.organisms)}",
-            f"Food: {len(world.food_system.food_energy)}",
+            f"Food: {world.food_system.food_count}",
             f"Zoom: {self.camera.zoom:.2f}",
             "",
             "Controls:",
@@ -212,19 +490,28 @@ class Renderer:
             "F11: fullscreen | Drag: pan"
         ]
         
+        # No per-line try/except here: the strings are all well-formed and
+        # render_world's top-level handler catches anything unexpected
         y = 10
         for stat in stats:
-            try:
-                if stat:  # Skip empty lines
-                    text = self.font_small.render(stat, True, self.COLORS["TextPrimary"])
-                    self.screen.blit(text, (10, y))
-                y += 18
-            except Exception as e:
-                logger.warning(f"Failed to render HUD text '{stat}': {e}")
+            if stat:  # Skip empty lines
+                text = self._render_text(self.font_small, stat, self.COLORS["TextPrimary"])
+                self.screen.blit(text, (10, y))
+            y += 18
     
     def render_stats(self, stats):
         """Render comprehensive statistics view"""
         try:
+            # The underlying numbers only change when stats record a new
+            # tick, so between ticks just replay the cached frame instead
+            # of re-rasterizing ~25 text strings and the graph
+            if (self._stats_surface is not None and
+                    self._stats_surface_tick == stats.current_tick and
+                    self._stats_surface.get_size() == self.screen.get_size()):
+                self.screen.blit(self._stats_surface, (0, 0))
+                pygame.display.flip()
+                return
+
             # Clear screen
             self.screen.fill(self.COLORS["StatsBackground"])
             
@@ -236,7 +523,7 @@ class Renderer:
             col_width = (self.screen_width - 3 * margin) // 2
             
             # Title
-            title_text = self.font_large.render("Simulation Statistics", True, self.COLORS["TextPrimary"])
+            title_text = self._render_text(self.font_large, "Simulation Statistics", self.COLORS["TextPrimary"])
             title_rect = title_text.get_rect(center=(self.screen_width // 2, 30))
             self.screen.blit(title_text, title_rect)
             
@@ -273,10 +560,11 @@ class Renderer:
             y = 70
             
             # Population graph
-            if stats.population_history:
+            history = stats.get_history_view()
+            if history['tick'].size:
                 self._render_population_graph(right_x, y, 
                                             col_width - margin, 120, 
-                                            stats.population_history)
+                                            history)
             
             y += 140
             # Trait distribution
@@ -295,10 +583,13 @@ class Renderer:
                                           self.screen_width - 2 * margin, stats.notable_events)
             
             # Exit instructions
-            exit_text = self.font.render("Press T to return to simulation", True, self.COLORS["TextSecondary"])
+            exit_text = self._render_text(self.font, "Press T to return to simulation", self.COLORS["TextSecondary"])
             exit_rect = exit_text.get_rect(center=(self.screen_width // 2, self.screen_height - 20))
             self.screen.blit(exit_text, exit_rect)
-            
+
+            self._stats_surface = self.screen.copy()
+            self._stats_surface_tick = stats.current_tick
+
             pygame.display.flip()
             
         except Exception as e:
@@ -308,13 +599,13 @@ class Renderer:
     def _render_section(self, title, x, y, lines):
         """Render a statistics section"""
         # Title
-        title_text = self.font.render(title, True, self.COLORS["TextPrimary"])
+        title_text = self._render_text(self.font, title, self.COLORS["TextPrimary"])
         self.screen.blit(title_text, (x, y))
         
         # Lines
         y += 30
         for line in lines:
-            text = self.font_small.render(line, True, self.COLORS["TextSecondary"])
+            text = self._render_text(self.font_small, line, self.COLORS["TextSecondary"])
             self.screen.blit(text, (x + 10, y))
             y += 20
     
@@ -325,80 +616,79 @@ class Renderer:
                         (x, y, width, height), 1)
         
         # Title
-        title = self.font_small.render("Population Over Time", True, self.COLORS["TextPrimary"])
+        title = self._render_text(self.font_small, "Population Over Time", self.COLORS["TextPrimary"])
         self.screen.blit(title, (x + 5, y - 20))
         
-        if len(history) < 2:
-            return
-        
-        # Get data points
-        points = [(h.tick, h.total_cells) for h in history[-100:]]  # Last 100 points
-        if not points:
+        if history['tick'].size < 2:
             return
-        
+
+        # History arrives as ordered column arrays, so the last-100 window,
+        # scaling and projection are all vector ops
+        ticks = history['tick'][-100:].astype(np.int64)
+        pops = history['total_cells'][-100:].astype(np.int64)
+
         # Find min/max for scaling
-        min_pop = min(p[1] for p in points)
-        max_pop = max(p[1] for p in points)
+        min_pop = int(pops.min())
+        max_pop = int(pops.max())
         pop_range = max_pop - min_pop if max_pop != min_pop else 1
-        
-        min_tick = points[0][0]
-        max_tick = points[-1][0]
+
+        min_tick = int(ticks[0])
+        max_tick = int(ticks[-1])
         tick_range = max_tick - min_tick if max_tick != min_tick else 1
-        
+
         # Convert to screen coordinates
-        screen_points = []
-        for tick, pop in points:
-            sx = x + int((tick - min_tick) / tick_range * (width - 10)) + 5
-            sy = y + height - int((pop - min_pop) / pop_range * (height - 10)) - 5
-            screen_points.append((sx, sy))
-        
+        sxs = x + ((ticks - min_tick) / tick_range * (width - 10)).astype(np.int64) + 5
+        sys_ = y + height - ((pops - min_pop) / pop_range * (height - 10)).astype(np.int64) - 5
+        screen_points = list(zip(sxs.tolist(), sys_.tolist()))
+
         # Draw line
         if len(screen_points) > 1:
-            pygame.draw.lines(self.screen, self.COLORS["GraphLine"], 
+            pygame.draw.lines(self.screen, self.COLORS["GraphLine"],
                             False, screen_points, 2)
         
         # Draw labels
-        pop_label = self.font_small.render(f"{max_pop:,}", True, self.COLORS["TextSecondary"])
+        pop_label = self._render_text(self.font_small, f"{max_pop:,}", self.COLORS["TextSecondary"])
         self.screen.blit(pop_label, (x + width + 5, y))
         
-        pop_label = self.font_small.render(f"{min_pop:,}", True, self.COLORS["TextSecondary"])
+        pop_label = self._render_text(self.font_small, f"{min_pop:,}", self.COLORS["TextSecondary"])
         self.screen.blit(pop_label, (x + width + 5, y + height - 15))
     
     def _render_trait_distribution(self, x, y, traits):
         """Render trait distribution"""
-        title_text = self.font.render("Trait Distribution", True, self.COLORS["TextPrimary"])
+        title_text = self._render_text(self.font, "Trait Distribution", self.COLORS["TextPrimary"])
         self.screen.blit(title_text, (x, y))
         
         y += 30
         for trait, count in sorted(traits.items(), key=lambda x: x[1], reverse=True)[:5]:
-            text = self.font_small.render(f"{trait}: {count}", True, self.COLORS["TextSecondary"])
+            text = self._render_text(self.font_small, f"{trait}: {count}", self.COLORS["TextSecondary"])
             self.screen.blit(text, (x + 10, y))
             y += 20
     
     def _render_genome_leaderboard(self, x, y, leaderboard):
         """Render top genomes"""
-        title_text = self.font.render("Top Genomes", True, self.COLORS["TextPrimary"])
+        title_text = self._render_text(self.font, "Top Genomes", self.COLORS["TextPrimary"])
         self.screen.blit(title_text, (x, y))
         
         y += 30
         for i, (genome, stats) in enumerate(leaderboard[:5]):
             # Truncate long genomes
             display_genome = genome if len(genome) <= 30 else genome[:27] + "..."
-            text = self.font_small.render(
+            text = self._render_text(
+                self.font_small,
                 f"{i+1}. {display_genome} (pop: {stats.peak_population})",
-                True, self.COLORS["TextSecondary"]
+                self.COLORS["TextSecondary"]
             )
             self.screen.blit(text, (x + 10, y))
             y += 20
     
     def _render_notable_events(self, x, y, width, events):
         """Render notable events"""
-        title_text = self.font.render("Notable Events", True, self.COLORS["TextPrimary"])
+        title_text = self._render_text(self.font, "Notable Events", self.COLORS["TextPrimary"])
         self.screen.blit(title_text, (x, y))
         
         y += 25
         for event in list(events)[-3:]:  # Show last 3 events
-            text = self.font_small.render(event, True, self.COLORS["TextSecondary"])
+            text = self._render_text(self.font_small, event, self.COLORS["TextSecondary"])
             self.screen.blit(text, (x + 10, y))
             y += 20
     
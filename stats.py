@@ -1,26 +1,31 @@
 # stats.py
 import logging
+import re
 import time
 from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional
 import numpy as np
 
+from config import Config
+
 logger = logging.getLogger('stats')
 
-@dataclass
-class PopulationSnapshot:
-    """Point-in-time population data"""
-    tick: int
-    timestamp: float
-    total_cells: int
-    total_organisms: int
-    total_food: int
-    births: int = 0
-    deaths: int = 0
-    mutations: int = 0
-    food_consumed: int = 0
-    cells_eaten: int = 0
+# Cached debug-enabled flag so the record_* hot paths skip the string build
+# and logging call when debug logging is off. Refreshed by
+# Config.setup_logging after levels are configured.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+# Trait pattern, matching dna.py's, so record_birth can derive a new
+# genome's trait set without a parser round-trip
+_TRAIT_RE = re.compile(r'\[([^\]]+)\]')
+
+# Columns of the population-history ring buffer (one int32 array each;
+# timestamp is kept separately as float64)
+_HISTORY_FIELDS = ('tick', 'total_cells', 'total_organisms', 'total_food',
+                   'births', 'deaths', 'mutations', 'food_consumed',
+                   'cells_eaten')
 
 @dataclass
 class GenomeStats:
@@ -31,8 +36,14 @@ class GenomeStats:
     peak_population: int
     total_births: int
     total_deaths: int
-    avg_lifespan: float
+    total_lifespan: int = 0
     trait_set: set = field(default_factory=set)
+    trait_list: tuple = ()
+
+    @property
+    def avg_lifespan(self) -> float:
+        """Mean age at death, derived lazily from the integer lifespan sum"""
+        return self.total_lifespan / self.total_deaths if self.total_deaths else 0.0
 
 class SimulationStats:
     """Comprehensive statistics tracking for the cellular evolution simulation"""
@@ -42,7 +53,9 @@ class SimulationStats:
         
         # Configuration
         self.history_size = history_size
-        self.start_time = time.time()
+        # perf_counter throughout: monotonic, immune to clock steps, and
+        # sampled once per update instead of once per consumer
+        self.start_time = time.perf_counter()
         self.current_tick = 0
         
         # Real-time counters
@@ -63,8 +76,15 @@ class SimulationStats:
         self.tick_cells_eaten = 0
         self.tick_movements = 0
         
-        # Historical data
-        self.population_history = deque(maxlen=history_size)
+        # Historical data. Population history is columnar: one ring-buffer
+        # array per field instead of a deque of snapshot objects, so the
+        # per-tick append is a handful of indexed writes and consumers get
+        # NumPy columns to reduce over directly
+        self.history = {k: np.zeros(history_size, dtype=np.int32)
+                        for k in _HISTORY_FIELDS}
+        self.history['timestamp'] = np.zeros(history_size, dtype=np.float64)
+        self._hist_head = 0
+        self._hist_len = 0
         self.food_history = deque(maxlen=history_size)
         self.genome_diversity_history = deque(maxlen=history_size)
         
@@ -80,13 +100,19 @@ class SimulationStats:
         # Spatial statistics
         self.cell_density_grid = None
         self.movement_heatmap = None
+        # Movement events buffered here and scattered into the heatmap in
+        # one np.add.at per stats update instead of a scalar ndarray write
+        # per move
+        self._move_buf_x = np.empty(4096, dtype=np.int32)
+        self._move_buf_y = np.empty(4096, dtype=np.int32)
+        self._move_buf_n = 0
         self.death_locations = deque(maxlen=500)
         self.birth_locations = deque(maxlen=500)
         
         # Performance metrics
         self.update_times = deque(maxlen=100)
         self.tick_durations = deque(maxlen=100)
-        self.last_update_time = time.time()
+        self.last_update_time = time.perf_counter()
         
         # Interesting events
         self.notable_events = deque(maxlen=50)
@@ -99,99 +125,130 @@ class SimulationStats:
         self.total_energy_in_system = 0
         self.energy_history = deque(maxlen=history_size)
         self.energy_distribution = []
+        self._cached_cell_energy = None  # Reductions reused on quiet ticks
+        
+        # Worker thread for the heavy reductions: update() snapshots what
+        # it needs from the world synchronously, then the aggregation runs
+        # here while the next world tick proceeds
+        self._executor = ThreadPoolExecutor(max_workers=1,
+                                            thread_name_prefix='stats')
+        self._pending = None
         
         logger.debug("Statistics tracker initialized with all subsystems")
     
     def update(self, world, tick: int):
-        """Update statistics with current world state"""
-        start_time = time.time()
+        """Update statistics with current world state.
+
+        Only the snapshot runs on the caller's (simulation) thread; the
+        reductions are handed to the worker so they overlap the next
+        world tick.
+        """
+        if self._pending is not None:
+            self._pending.result()  # One update in flight at a time
+        snap = self._snapshot_world(world, tick)
+        self._pending = self._executor.submit(self._apply_update, snap)
+    
+    def _snapshot_world(self, world, tick: int) -> dict:
+        """Capture everything _apply_update needs while the world is
+        stable, claiming the per-tick counters and movement buffer so
+        events recorded during the next tick aren't lost"""
+        store = world.cell_store
+        alive = store.alive
+        n = self._move_buf_n
+        snap = {
+            'tick': tick,
+            'now': time.perf_counter(),
+            'total_cells': len(world.cells),
+            'total_organisms': len(world.organisms),
+            'total_food': world.food_system.food_count,
+            'food_energy': world.food_system.total_energy(),
+            'drain_tick': world.tick_counter % Config.ENERGY_DRAIN_INTERVAL == 0,
+            'width': world.width,
+            'height': world.height,
+            'xs': store.x[alive],
+            'ys': store.y[alive],
+            'energy': store.energy[alive],
+            'move_x': self._move_buf_x[:n].copy(),
+            'move_y': self._move_buf_y[:n].copy(),
+            'births': self.tick_births,
+            'deaths': self.tick_deaths,
+            'mutations': self.tick_mutations,
+            'food_consumed': self.tick_food_consumed,
+            'cells_eaten': self.tick_cells_eaten,
+        }
+        self._move_buf_n = 0
+        self.tick_births = 0
+        self.tick_deaths = 0
+        self.tick_mutations = 0
+        self.tick_food_consumed = 0
+        self.tick_cells_eaten = 0
+        self.tick_movements = 0
+        return snap
+    
+    def _apply_update(self, snap: dict):
+        """Worker-thread half of update(): aggregate a world snapshot"""
+        start = time.perf_counter()
+        now = snap['now']
+        tick = snap['tick']
         self.current_tick = tick
         
-        # Calculate current population stats
-        current_cells = len(world.cells)
-        current_organisms = len(world.organisms)
-        current_food = len(world.food_system.food_energy)
-        
-        # Create snapshot
-        snapshot = PopulationSnapshot(
-            tick=tick,
-            timestamp=time.time(),
-            total_cells=current_cells,
-            total_organisms=current_organisms,
-            total_food=current_food,
-            births=self.tick_births,
-            deaths=self.tick_deaths,
-            mutations=self.tick_mutations,
-            food_consumed=self.tick_food_consumed,
-            cells_eaten=self.tick_cells_eaten
-        )
-        
-        # Update histories
-        self.population_history.append(snapshot)
-        self.food_history.append(current_food)
+        # Write this tick's snapshot into the ring buffer columns
+        hist = self.history
+        slot = self._hist_head
+        hist['tick'][slot] = tick
+        hist['timestamp'][slot] = now
+        hist['total_cells'][slot] = snap['total_cells']
+        hist['total_organisms'][slot] = snap['total_organisms']
+        hist['total_food'][slot] = snap['total_food']
+        hist['births'][slot] = snap['births']
+        hist['deaths'][slot] = snap['deaths']
+        hist['mutations'][slot] = snap['mutations']
+        hist['food_consumed'][slot] = snap['food_consumed']
+        hist['cells_eaten'][slot] = snap['cells_eaten']
+        self._hist_head = (slot + 1) % self.history_size
+        if self._hist_len < self.history_size:
+            self._hist_len += 1
+        
+        self.food_history.append(snap['total_food'])
         
         # Update genome statistics
-        self._update_genome_stats(world)
+        self._update_genome_stats()
         
         # Update trait distribution
-        self._update_trait_distribution(world)
+        self._update_trait_distribution()
         
         # Update spatial statistics
-        self._update_spatial_stats(world)
+        self._update_spatial_stats(snap)
         
         # Update energy economy
-        self._update_energy_stats(world)
+        self._update_energy_stats(snap)
         
         # Check for notable events
-        self._check_notable_events(world, snapshot)
+        self._check_notable_events(snap)
         
         # Update performance metrics
-        update_time = time.time() - start_time
+        update_time = time.perf_counter() - start
         self.update_times.append(update_time)
         
-        # Calculate tick duration
-        current_time = time.time()
-        tick_duration = current_time - self.last_update_time
+        # Tick duration measures snapshot-to-snapshot time
+        tick_duration = now - self.last_update_time
         self.tick_durations.append(tick_duration)
-        self.last_update_time = current_time
+        self.last_update_time = now
         
-        # Reset per-tick counters
-        self.tick_births = 0
-        self.tick_deaths = 0
-        self.tick_mutations = 0
-        self.tick_food_consumed = 0
-        self.tick_cells_eaten = 0
-        self.tick_movements = 0
-        
-        logger.debug(f"Stats update completed in {update_time:.3f}s")
+        if __debug__ and _DEBUG:
+            logger.debug("Stats update completed in %.3fs", update_time)
     
-    def _update_genome_stats(self, world):
+    def _update_genome_stats(self):
         """Update genome-related statistics"""
-        # Reset active genome counts
-        self.active_genomes.clear()
-        
-        # Count active genomes
-        for organism in world.organisms.values():
-            genome = organism.genome
-            self.active_genomes[genome] += 1
-            
-            # Update or create genome stats
-            if genome not in self.genome_stats:
-                self.genome_stats[genome] = GenomeStats(
-                    genome=genome,
-                    first_seen=self.current_tick,
-                    last_seen=self.current_tick,
-                    peak_population=1,
-                    total_births=1,
-                    total_deaths=0,
-                    avg_lifespan=0.0,
-                    trait_set=set(organism.traits)
-                )
-                logger.info(f"New genome discovered: '{genome}' with traits {organism.traits}")
-            else:
-                stats = self.genome_stats[genome]
+        # active_genomes is maintained incrementally by record_birth and
+        # record_death, so this pass just refreshes last_seen and sweeps
+        # extinctions instead of re-counting every organism each tick.
+        # list() copies keep iteration safe while the simulation thread
+        # records events concurrently
+        for genome in list(self.active_genomes):
+            stats = self.genome_stats.get(genome)
+            if stats is not None:
                 stats.last_seen = self.current_tick
-                stats.peak_population = max(stats.peak_population, self.active_genomes[genome])
         
         # Check for extinctions
         for genome, stats in list(self.genome_stats.items()):
@@ -204,72 +261,91 @@ class SimulationStats:
         genome_count = len(self.active_genomes)
         self.genome_diversity_history.append(genome_count)
     
-    def _update_trait_distribution(self, world):
+    def _update_trait_distribution(self):
         """Update trait distribution statistics"""
         self.trait_counts.clear()
         self.trait_combinations.clear()
-        
-        for organism in world.organisms.values():
-            # Count individual traits
-            for trait in organism.traits:
-                self.trait_counts[trait] += 1
-            
-            # Count trait combinations
-            trait_set = frozenset(organism.traits)
-            self.trait_combinations[trait_set] += 1
+
+        # active_genomes already holds the population per unique genome
+        # and GenomeStats carries each genome's trait list, so the tally
+        # walks each unique genome once and never touches world state -
+        # which is what lets it run on the worker thread
+        for genome, count in list(self.active_genomes.items()):
+            stats = self.genome_stats.get(genome)
+            if stats is None:
+                continue
+            for trait in stats.trait_list:
+                self.trait_counts[trait] += count
+            self.trait_combinations[frozenset(stats.trait_list)] += count
     
-    def _update_spatial_stats(self, world):
+    def _update_spatial_stats(self, snap):
         """Update spatial distribution statistics"""
         if self.cell_density_grid is None:
             # Initialize grids
             grid_size = 32  # Divide world into 32x32 chunks
-            grid_w = world.width // grid_size + 1
-            grid_h = world.height // grid_size + 1
+            grid_w = snap['width'] // grid_size + 1
+            grid_h = snap['height'] // grid_size + 1
             self.cell_density_grid = np.zeros((grid_w, grid_h))
             self.movement_heatmap = np.zeros((grid_w, grid_h))
         
-        # Reset density grid
-        self.cell_density_grid.fill(0)
-        
-        # Count cells per grid square
+        # Count cells per grid square in one bincount over the snapshotted
+        # live slots instead of a Python loop per cell
         grid_size = 32
-        for cell in world.cells.values():
-            gx = min(cell.x // grid_size, self.cell_density_grid.shape[0] - 1)
-            gy = min(cell.y // grid_size, self.cell_density_grid.shape[1] - 1)
-            self.cell_density_grid[gx, gy] += 1
+        grid_w, grid_h = self.cell_density_grid.shape
+        gx = np.minimum(snap['xs'] // grid_size, grid_w - 1)
+        gy = np.minimum(snap['ys'] // grid_size, grid_h - 1)
+        flat = gx.astype(np.intp) * grid_h + gy
+        self.cell_density_grid = np.bincount(
+            flat, minlength=grid_w * grid_h).reshape(grid_w, grid_h).astype(float)
+
+        # Flush the movement events claimed at snapshot time into the
+        # heatmap in one scatter
+        if snap['move_x'].size:
+            mx = np.minimum(snap['move_x'] // grid_size, grid_w - 1)
+            my = np.minimum(snap['move_y'] // grid_size, grid_h - 1)
+            np.add.at(self.movement_heatmap, (mx, my), 1)
     
-    def _update_energy_stats(self, world):
+    def _update_energy_stats(self, snap):
         """Update energy-related statistics"""
-        total_cell_energy = sum(cell.energy for cell in world.cells.values())
-        total_food_energy = sum(world.food_system.food_energy.values())
-        self.total_energy_in_system = total_cell_energy + total_food_energy
+        # Cell energy only changes through drain ticks, movement, eating,
+        # births and deaths. On ticks where none of those fired, reuse the
+        # cached reductions instead of rescanning the energy column
+        changed = (snap['births'] or snap['deaths'] or
+                   snap['food_consumed'] or snap['cells_eaten'] or
+                   snap['move_x'].size or snap['drain_tick'])
+        if changed or self._cached_cell_energy is None:
+            # One pass over the snapshotted energy column feeds every
+            # reduction (np.median is already selection-based via
+            # np.partition)
+            energies = snap['energy']
+            self._cached_cell_energy = int(energies.sum(dtype=np.int64))
+            if energies.size:
+                self.energy_distribution = {
+                    'min': int(energies.min()),
+                    'max': int(energies.max()),
+                    'mean': float(energies.mean()),
+                    'median': float(np.median(energies)),
+                    'std': float(energies.std())
+                }
+
+        self.total_energy_in_system = self._cached_cell_energy + snap['food_energy']
         self.energy_history.append(self.total_energy_in_system)
-        
-        # Energy distribution among cells
-        if world.cells:
-            energies = [cell.energy for cell in world.cells.values()]
-            self.energy_distribution = {
-                'min': min(energies),
-                'max': max(energies),
-                'mean': np.mean(energies),
-                'median': np.median(energies),
-                'std': np.std(energies)
-            }
     
-    def _check_notable_events(self, world, snapshot):
+    def _check_notable_events(self, snap):
         """Check for and record notable events"""
+        total_cells = snap['total_cells']
         # Population milestones
-        if snapshot.total_cells > self.largest_population_count:
-            self.largest_population_count = snapshot.total_cells
+        if total_cells > self.largest_population_count:
+            self.largest_population_count = total_cells
             self.largest_population_tick = self.current_tick
             self.notable_events.append(
-                f"Tick {self.current_tick}: New population record: {snapshot.total_cells} cells"
+                f"Tick {self.current_tick}: New population record: {total_cells} cells"
             )
         
         # Mass extinction event
-        if self.tick_deaths > snapshot.total_cells * 0.5 and snapshot.total_cells > 10:
+        if snap['deaths'] > total_cells * 0.5 and total_cells > 10:
             self.notable_events.append(
-                f"Tick {self.current_tick}: Mass extinction! {self.tick_deaths} deaths"
+                f"Tick {self.current_tick}: Mass extinction! {snap['deaths']} deaths"
             )
         
         # Diversity milestone
@@ -282,16 +358,73 @@ class SimulationStats:
                 )
     
     # Event recording methods (called by world.py)
+    def seed_population(self, organisms):
+        """Register organisms that existed before the tracker was linked.
+
+        record_birth only sees organisms born after set_stats_tracker runs,
+        but initial spawns and loaded worlds create theirs first. Seeding
+        active_genomes/genome_stats here keeps diversity, trait counts and
+        the leaderboard correct for founders, and stops their eventual
+        deaths from decrementing a zero count.
+        """
+        seeded = 0
+        for organism in organisms:
+            seeded += 1
+            genome = organism.genome
+            count = self.active_genomes[genome] + 1
+            self.active_genomes[genome] = count
+
+            stats = self.genome_stats.get(genome)
+            if stats is None:
+                traits = _TRAIT_RE.findall(genome)
+                self.genome_stats[genome] = GenomeStats(
+                    genome=genome,
+                    first_seen=self.current_tick,
+                    last_seen=self.current_tick,
+                    peak_population=count,
+                    total_births=0,
+                    total_deaths=0,
+                    trait_set=set(traits),
+                    trait_list=tuple(traits)
+                )
+                logger.info(f"New genome discovered: '{genome}' with traits {traits}")
+            elif count > stats.peak_population:
+                stats.peak_population = count
+
+        logger.debug("Seeded genome stats for %d pre-existing organisms", seeded)
+
     def record_birth(self, organism_id: int, parent_id: Optional[int], genome: str, x: int, y: int):
         """Record a birth event"""
         self.tick_births += 1
         self.total_births += 1
         self.birth_locations.append((x, y, self.current_tick))
         
-        if genome in self.genome_stats:
-            self.genome_stats[genome].total_births += 1
-        
-        logger.debug(f"Birth recorded: organism {organism_id} with genome '{genome}' at ({x}, {y})")
+        count = self.active_genomes[genome] + 1
+        self.active_genomes[genome] = count
+        
+        stats = self.genome_stats.get(genome)
+        if stats is None:
+            traits = _TRAIT_RE.findall(genome)
+            self.genome_stats[genome] = GenomeStats(
+                genome=genome,
+                first_seen=self.current_tick,
+                last_seen=self.current_tick,
+                peak_population=count,
+                total_births=1,
+                total_deaths=0,
+                trait_set=set(traits),
+                trait_list=tuple(traits)
+            )
+            logger.info(f"New genome discovered: '{genome}' with traits {traits}")
+        else:
+            stats.total_births += 1
+            stats.last_seen = self.current_tick
+            if count > stats.peak_population:
+                stats.peak_population = count
+        
+        if __debug__ and _DEBUG:
+            logger.debug("Birth recorded: organism %d with genome '%s' at (%d, %d)",
+                         organism_id, genome, x, y)
     
     def record_death(self, organism_id: int, genome: str, x: int, y: int, age: int):
         """Record a death event"""
@@ -299,21 +432,29 @@ class SimulationStats:
         self.total_deaths += 1
         self.death_locations.append((x, y, self.current_tick))
         
+        remaining = self.active_genomes[genome] - 1
+        if remaining > 0:
+            self.active_genomes[genome] = remaining
+        else:
+            self.active_genomes.pop(genome, None)
+        
         if genome in self.genome_stats:
             stats = self.genome_stats[genome]
+            # Integer accumulation only on the death hot path; the mean is
+            # derived on demand by the avg_lifespan property
             stats.total_deaths += 1
-            # Update average lifespan
-            if stats.total_deaths > 0:
-                stats.avg_lifespan = ((stats.avg_lifespan * (stats.total_deaths - 1) + age) / 
-                                    stats.total_deaths)
+            stats.total_lifespan += age
         
-        logger.debug(f"Death recorded: organism {organism_id} with genome '{genome}' at ({x}, {y}), age {age}")
+        if __debug__ and _DEBUG:
+            logger.debug("Death recorded: organism %d with genome '%s' at (%d, %d), age %d",
+                         organism_id, genome, x, y, age)
     
     def record_mutation(self, old_genome: str, new_genome: str):
         """Record a mutation event"""
         self.tick_mutations += 1
         self.total_mutations += 1
-        logger.debug(f"Mutation recorded: '{old_genome}' -> '{new_genome}'")
+        if __debug__ and _DEBUG:
+            logger.debug("Mutation recorded: '%s' -> '%s'", old_genome, new_genome)
     
     def record_food_consumed(self, amount: int):
         """Record food consumption"""
@@ -329,13 +470,16 @@ class SimulationStats:
         """Record cell movement"""
         self.tick_movements += 1
         self.total_movements += 1
-        
-        # Update movement heatmap
-        if self.movement_heatmap is not None:
-            grid_size = 32
-            gx = min(x // grid_size, self.movement_heatmap.shape[0] - 1)
-            gy = min(y // grid_size, self.movement_heatmap.shape[1] - 1)
-            self.movement_heatmap[gx, gy] += 1
+
+        # Buffer the position; the heatmap is updated in bulk at the next
+        # stats update
+        n = self._move_buf_n
+        if n >= self._move_buf_x.size:
+            self._move_buf_x = np.concatenate([self._move_buf_x, np.empty_like(self._move_buf_x)])
+            self._move_buf_y = np.concatenate([self._move_buf_y, np.empty_like(self._move_buf_y)])
+        self._move_buf_x[n] = x
+        self._move_buf_y[n] = y
+        self._move_buf_n = n + 1
     
     def record_reproduction_attempt(self, success: bool):
         """Record reproduction attempt"""
@@ -345,14 +489,15 @@ class SimulationStats:
     
     def get_summary(self) -> dict:
         """Get a summary of current statistics"""
-        runtime = time.time() - self.start_time
+        runtime = time.perf_counter() - self.start_time
         
         # Calculate rates
         birth_rate = self.total_births / max(runtime, 1)
         death_rate = self.total_deaths / max(runtime, 1)
         
-        # Get recent population if available
-        recent_pop = self.population_history[-1] if self.population_history else None
+        # Read the newest ring-buffer slot if any history exists
+        last = (self._hist_head - 1) % self.history_size if self._hist_len else 0
+        have_hist = self._hist_len > 0
         
         summary = {
             'runtime': runtime,
@@ -363,9 +508,9 @@ class SimulationStats:
             'birth_rate': birth_rate,
             'death_rate': death_rate,
             'population': {
-                'cells': recent_pop.total_cells if recent_pop else 0,
-                'organisms': recent_pop.total_organisms if recent_pop else 0,
-                'food': recent_pop.total_food if recent_pop else 0
+                'cells': int(self.history['total_cells'][last]) if have_hist else 0,
+                'organisms': int(self.history['total_organisms'][last]) if have_hist else 0,
+                'food': int(self.history['total_food'][last]) if have_hist else 0
             },
             'genome_diversity': len(self.active_genomes),
             'extinct_genomes': len(self.extinct_genomes),
@@ -382,6 +527,16 @@ class SimulationStats:
         
         return summary
     
+    def get_history_view(self) -> dict:
+        """Return the population history as chronologically ordered column
+        arrays (oldest first)"""
+        n = self._hist_len
+        if n < self.history_size:
+            return {k: col[:n] for k, col in self.history.items()}
+        head = self._hist_head
+        return {k: np.concatenate((col[head:], col[:head]))
+                for k, col in self.history.items()}
+    
     def get_genome_leaderboard(self, top_n: int = 10) -> List[Tuple[str, GenomeStats]]:
         """Get the most successful genomes by various metrics"""
         # Sort by peak population
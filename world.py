@@ -1,31 +1,104 @@
 # world.py
+import itertools
 import numpy as np
 import logging
-from scipy.sparse import dok_matrix
-from collections import defaultdict
 import random
-from cell import Cell, Organism
+from cell import Cell, CellStore, Organism
 from food import FoodSystem
-from dna import DNAParser
+from dna import DNAParser, CAN_MOVE, CAN_EAT
 from config import Config
 from typing import Optional
 
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
 logger = logging.getLogger('world')
 
+# Cached debug-enabled flag so the per-cell hot paths skip both the string
+# build and the logging call when debug logging is off. Refreshed by
+# Config.setup_logging after levels are configured.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _age_drain_and_filter(age, energy, organism_id, alive,
+                              drain_costs, flags, drain, repro_threshold):
+        """Single native pass over the SoA store: age every live cell,
+        apply the periodic drain, and compact the slots of cells that need
+        Python-level behavior (movement/eating flags set, or energy above
+        the reproduction threshold). Fuses what the NumPy fallback does in
+        separate masked add/subtract/compare/gather passes."""
+        n = alive.size
+        active_slots = np.empty(n, dtype=np.int64)
+        count = 0
+        drained = 0
+        for i in range(n):
+            if not alive[i]:
+                continue
+            age[i] += 1
+            oid = organism_id[i]
+            if drain:
+                energy[i] -= drain_costs[oid]
+                drained += 1
+            if flags[oid] != 0 or energy[i] > repro_threshold:
+                active_slots[count] = i
+                count += 1
+        return count, active_slots, drained
+
+def _interleave_bits(v):
+    """Spread the low 16 bits of each value so they occupy even bit
+    positions (standard SWAR expansion used to build Morton codes)"""
+    v = (v | (v << 8)) & np.uint32(0x00FF00FF)
+    v = (v | (v << 4)) & np.uint32(0x0F0F0F0F)
+    v = (v | (v << 2)) & np.uint32(0x33333333)
+    v = (v | (v << 1)) & np.uint32(0x55555555)
+    return v
+
+# All 24 orderings of the four cardinal directions. Picking one with a
+# single random index replaces the three draws and swaps random.shuffle
+# performs on every move attempt
+_DIR_PERMS = tuple(itertools.permutations(((0, 1), (1, 0), (0, -1), (-1, 0))))
+
+# 8-neighborhood offsets, hoisted so hot loops don't rebuild the [-1, 0, 1]
+# list literals and re-test the (0, 0) case on every call
+_NEIGHBOR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
 class World:
     def __init__(self, width, height):
         logger.info(f"Initializing world with dimensions {width}x{height}")
         
         self.width = width
         self.height = height
-        self.cells = {}  # cell_id -> Cell
+        self.cell_store = CellStore()  # SoA backing arrays for cell data
+        self.cells = {}  # cell_id -> Cell (view into cell_store)
         self.organisms = {}  # organism_id -> Organism
-        self.spatial_hash = defaultdict(set)
-        self.walls = dok_matrix((width, height), dtype=bool)
+        # Dense occupancy grid: cell id at (x, y), or -1. With the cell
+        # stacking limit at 1 a position holds at most one cell, so a
+        # single array load replaces the old bucket-hash lookup
+        self.occupancy = np.full((width, height), -1, dtype=np.int32)
+        # Dense boolean grid: scalar reads are a single C-level load and,
+        # unlike the earlier coordinate set, the array can be handed
+        # straight to vectorized/numba tick kernels (1 MiB at 1024x1024)
+        self.walls = np.zeros((width, height), dtype=np.bool_)
+        self._wall_coords = None  # Cached (xs, ys) arrays, rebuilt when walls change
         self.food_system = FoodSystem(width, height)
         self.next_cell_id = 0
         self.next_organism_id = 0
+        self._free_organism_ids = []  # Recycled ids of dead organisms
+        # organism_id -> palette color id / per-drain energy cost, kept
+        # dense so the renderer and the tick loop can gather per-cell
+        # values with vectorized indexing instead of per-cell dict lookups.
+        # The cost table stores len(genome) * GENOME_ENERGY_COST, computed
+        # once at spawn, so the drain pass is a gather-subtract with no
+        # per-cell multiply
+        self.organism_color_ids = np.zeros(256, dtype=np.int8)
+        self.organism_drain_costs = np.zeros(256, dtype=np.int32)
+        self.organism_flags = np.zeros(256, dtype=np.int8)
         self.dna_parser = DNAParser()
+        self.rng = np.random.default_rng()  # Batched draws for spawn probing
         self.tick_counter = 0  # NEW: For energy drain timing
         self.stats = None  # Will be set by main.py
         
@@ -36,18 +109,22 @@ class World:
     def set_stats_tracker(self, stats):
         """Set the statistics tracker"""
         self.stats = stats
+        # Organisms spawned before the tracker is linked (initial spawns,
+        # worlds loaded via from_dict) never went through record_birth, so
+        # seed the genome accounting with the current population
+        if self.organisms:
+            stats.seed_population(self.organisms.values())
         logger.debug("Statistics tracker linked to world")
     
     def _setup_default_environment(self):
         """Create some walls and food clusters"""
         logger.info("Setting up default environment")
         
-        # Simple walls
-        wall_count = 0
-        for x in range(200, 250):
-            self.walls[x, 300] = True
-            self.walls[x, 700] = True
-            wall_count += 2
+        # Simple walls, set as two slice assignments instead of 100
+        # scalar stores
+        self.walls[200:250, 300] = True
+        self.walls[200:250, 700] = True
+        wall_count = 100
         logger.debug(f"Created {wall_count} wall segments")
         
         # Enhanced food clusters - MORE FOOD
@@ -59,73 +136,118 @@ class World:
         self.food_system.spawn_gaussian_cluster(100, 600, 40, 0.3)
         self.food_system.spawn_gaussian_cluster(700, 200, 40, 0.3)
         
-        total_food = len(self.food_system.food_energy)
+        total_food = self.food_system.food_count
         logger.info(f"Default environment setup complete: {wall_count} walls, {total_food} food items")
     
     def spawn_organism(self, genome, x, y, spread):
         """Spawn an organism near x,y with given genome"""
         logger.debug(f"Attempting to spawn organism with genome '{genome}' near ({x}, {y}) with spread {spread}")
         
-        traits = self.dna_parser.parse(genome)
-        if not traits:
+        parsed = self.dna_parser.parse(genome)
+        if not parsed:
             logger.warning(f"Failed to parse genome '{genome}' - no valid traits found")
             return None
-        
-        logger.debug(f"Parsed traits from genome: {traits}")
-            
-        # Find spawn location
-        for attempt in range(100):
-            dx = random.randint(-spread, spread)
-            dy = random.randint(-spread, spread)
-            spawn_x = max(0, min(self.width-1, x + dx))
-            spawn_y = max(0, min(self.height-1, y + dy))
-            
-            # Check cell stacking limit
-            existing_cells = self._get_cells_at_position(spawn_x, spawn_y)
+
+        logger.debug(f"Parsed traits from genome: {parsed.traits}")
             
-            if (not self.walls[spawn_x, spawn_y] and 
-                len(existing_cells) < Config.MAX_CELLS_PER_LOCATION):
-                
-                # Create organism
-                organism = Organism(self.next_organism_id, genome, traits)
-                self.organisms[self.next_organism_id] = organism
-                organism.birth_tick = self.tick_counter  # Track birth time
-                logger.debug(f"Created organism {self.next_organism_id} with color {organism.color}")
-                self.next_organism_id += 1
-                
-                # Create initial cell with FIXED energy calculation
-                cell = Cell(self.next_cell_id, spawn_x, spawn_y, organism.id)
-                cell.energy = Config.STARTING_ENERGY - len(genome)  # Still subtract genome length once
-                self.cells[self.next_cell_id] = cell
-                organism.cell_ids.add(cell.id)
-                
-                logger.debug(f"Created cell {self.next_cell_id} at ({spawn_x}, {spawn_y}) "
-                           f"with energy {cell.energy}")
-                self.next_cell_id += 1
-                
-                # Update spatial hash
-                self._update_spatial_hash(cell)
-                
-                # Record birth in stats
-                if self.stats:
-                    self.stats.record_birth(organism.id, None, genome, spawn_x, spawn_y)
-                
-                logger.info(f"Successfully spawned organism {organism.id} at ({spawn_x}, {spawn_y}) "
-                          f"after {attempt + 1} attempts")
-                return organism
-        
-        logger.warning(f"Failed to find spawn location for organism near ({x}, {y}) after 100 attempts")
-        return None
+        # Find spawn location. One batched PCG64 draw covers all probe
+        # offsets, and the wall/occupancy tests run as one fancy-indexed
+        # mask over the dense grids instead of up to 100 scalar probes.
+        offsets = self.rng.integers(-spread, spread + 1, size=(100, 2))
+        xs = np.clip(x + offsets[:, 0], 0, self.width - 1)
+        ys = np.clip(y + offsets[:, 1], 0, self.height - 1)
+        valid = ~self.walls[xs, ys] & (self.occupancy[xs, ys] < 0)
+        if not valid.any():
+            logger.warning(f"Failed to find spawn location for organism near ({x}, {y}) after 100 attempts")
+            return None
+
+        attempt = int(np.argmax(valid))  # First open candidate, matching the old loop order
+        spawn_x = int(xs[attempt])
+        spawn_y = int(ys[attempt])
+
+        # Create organism
+        organism = Organism(self._alloc_organism_id(), genome, parsed)
+        self.organisms[organism.id] = organism
+        self._record_organism_color(organism)
+        organism.birth_tick = self.tick_counter  # Track birth time
+        logger.debug(f"Created organism {organism.id} with color {organism.color}")
+
+        # Create initial cell with FIXED energy calculation
+        cell = self._create_cell(spawn_x, spawn_y, organism.id,
+                                 Config.STARTING_ENERGY - len(genome))  # Still subtract genome length once
+        organism.cell_ids.add(cell.id)
+
+        logger.debug(f"Created cell {cell.id} at ({spawn_x}, {spawn_y}) "
+                   f"with energy {cell.energy}")
+
+        # Update spatial hash
+        self._update_spatial_hash(cell)
+
+        # Record birth in stats
+        if self.stats:
+            self.stats.record_birth(organism.id, None, genome, spawn_x, spawn_y)
+
+        logger.info(f"Successfully spawned organism {organism.id} at ({spawn_x}, {spawn_y}) "
+                  f"after {attempt + 1} attempts")
+        return organism
     
+    def _create_cell(self, x, y, organism_id, energy):
+        """Allocate a cell in the backing store and register its view"""
+        slot = self.cell_store.allocate(x, y, organism_id, energy, cell_id=self.next_cell_id)
+        cell = Cell(self.next_cell_id, self.cell_store, slot)
+        self.cells[self.next_cell_id] = cell
+        self.next_cell_id += 1
+        return cell
+
+    def _alloc_organism_id(self):
+        """Claim an organism id, reusing ids freed by dead organisms.
+
+        Recycling through a freelist (same scheme as CellStore slots)
+        keeps the dense per-organism arrays sized to the peak live
+        population instead of growing with every organism ever spawned.
+        """
+        if self._free_organism_ids:
+            return self._free_organism_ids.pop()
+        oid = self.next_organism_id
+        self.next_organism_id += 1
+        return oid
+
+    def _record_organism_color(self, organism):
+        """Mirror an organism's palette id, genome length and behavior
+        flags into the dense per-organism arrays"""
+        if organism.id >= self.organism_color_ids.size:
+            size = self.organism_color_ids.size
+            grown_colors = np.zeros(size * 2, dtype=np.int8)
+            grown_colors[:size] = self.organism_color_ids
+            self.organism_color_ids = grown_colors
+            grown_costs = np.zeros(size * 2, dtype=np.int32)
+            grown_costs[:size] = self.organism_drain_costs
+            self.organism_drain_costs = grown_costs
+            grown_flags = np.zeros(size * 2, dtype=np.int8)
+            grown_flags[:size] = self.organism_flags
+            self.organism_flags = grown_flags
+        self.organism_color_ids[organism.id] = organism.color_id
+        self.organism_drain_costs[organism.id] = (
+            len(organism.genome) * Config.GENOME_ENERGY_COST)
+        self.organism_flags[organism.id] = organism.flags
+
+    def _has_space(self, x, y):
+        """Whether a tile (already bounds-checked) can accept a cell.
+
+        One occupancy load - the grid stores a single id per tile, which
+        is exact because MAX_CELLS_PER_LOCATION is 1.
+        """
+        return self.occupancy[x, y] < 0
+
     def _get_cells_at_position(self, x, y):
         """Get all cells at a specific position"""
-        cells = []
-        hash_key = self._get_hash(x, y)
-        for cell_id in self.spatial_hash[hash_key]:
-            cell = self.cells.get(cell_id)
-            if cell and cell.x == x and cell.y == y:
-                cells.append(cell)
-        return cells
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return []
+        cell_id = self.occupancy[x, y]
+        if cell_id < 0:
+            return []
+        cell = self.cells.get(int(cell_id))
+        return [cell] if cell is not None else []
     
     def update(self):
         """Main update loop"""
@@ -144,44 +266,75 @@ class World:
         ate_cell_count = 0
         energy_drained_count = 0
         
-        for cell_id, cell in list(self.cells.items()):
+        # Aging, the periodic energy drain, and the active-cell filter
+        # (only cells whose organism can move/eat, or whose energy clears
+        # the reproduction threshold, need Python-level behavior) run over
+        # the whole SoA store before the behavior loop. With numba the
+        # three fuse into one native pass; the NumPy fallback does the
+        # same work in a few masked/broadcast operations
+        store = self.cell_store
+        alive = store.alive
+        if _HAS_NUMBA:
+            count, active_slots, drained = _age_drain_and_filter(
+                store.age, store.energy, store.organism_id, alive,
+                self.organism_drain_costs,
+                self.organism_flags, should_drain_energy,
+                Config.REPRODUCTION_THRESHOLD)
+            if should_drain_energy:
+                energy_drained_count = drained
+            active_slots = active_slots[:count]
+        else:
+            np.add(store.age, 1, out=store.age, where=alive)
+            if should_drain_energy:
+                costs = self.organism_drain_costs[store.organism_id]
+                np.subtract(store.energy, costs, out=store.energy, where=alive)
+                energy_drained_count = int(np.count_nonzero(alive))
+            flags_by_cell = self.organism_flags[store.organism_id]
+            active = alive & ((flags_by_cell != 0) |
+                              (store.energy > Config.REPRODUCTION_THRESHOLD))
+            active_slots = np.nonzero(active)[0]
+
+        # Visit active cells in Morton order of their positions so the
+        # occupancy, wall, and food probes of spatially adjacent cells
+        # land on warm cache lines instead of striding the grids randomly
+        if active_slots.size > 1:
+            keys = (_interleave_bits(store.x[active_slots].astype(np.uint32)) |
+                    (_interleave_bits(store.y[active_slots].astype(np.uint32)) << 1))
+            active_slots = active_slots[np.argsort(keys)]
+        active_cell_ids = store.cell_id[active_slots].tolist()
+
+        for cell_id in active_cell_ids:
+            cell = self.cells.get(cell_id)
+            if cell is None:
+                continue  # Eaten earlier in this same pass
             organism = self.organisms.get(cell.organism_id)
             if not organism:
                 logger.warning(f"Cell {cell_id} has invalid organism_id {cell.organism_id}")
                 dead_cells.append(cell_id)
                 continue
             
-            # Age the cell
-            cell.age += 1
-                
-            # NEW: Energy drain only happens periodically
-            if should_drain_energy:
-                energy_before = cell.energy
-                # FIXED: Much gentler energy drain
-                energy_cost = len(organism.genome) * Config.GENOME_ENERGY_COST
-                cell.energy -= energy_cost
-                energy_drained_count += 1
-                logger.debug(f"Cell {cell_id} energy drain: {energy_before} -> {cell.energy} "
-                            f"(cost: {energy_cost})")
-            
-            # Execute behaviors
-            if "CanMove" in organism.traits:
+            # Execute behaviors (flag bits precomputed at parse time)
+            if organism.flags & CAN_MOVE:
                 old_pos = (cell.x, cell.y)
                 moved = self._move_cell(cell)
                 if moved:
                     moved_count += 1
                     if self.stats:
                         self.stats.record_movement(cell.x, cell.y)
-                    logger.debug(f"Cell {cell_id} moved from {old_pos} to ({cell.x}, {cell.y})")
+                    if __debug__ and _DEBUG:
+                        logger.debug("Cell %d moved from %s to (%d, %d)", cell_id, old_pos, cell.x, cell.y)
             
-            if "CanEat" in organism.traits:
-                energy = self.food_system.eat_food(cell.x, cell.y)
-                if energy > 0:
+            if organism.flags & CAN_EAT:
+                # One grid read settles the common no-food case before
+                # paying for the eat_food call
+                if self.food_system.food_grid[cell.x, cell.y]:
+                    energy = self.food_system.eat_food(cell.x, cell.y)
                     cell.energy += energy
                     ate_food_count += 1
                     if self.stats:
                         self.stats.record_food_consumed(energy)
-                    logger.debug(f"Cell {cell_id} ate food and gained {energy} energy")
+                    if __debug__ and _DEBUG:
+                        logger.debug("Cell %d ate food and gained %d energy", cell_id, energy)
                 else:
                     # Try to eat other cells
                     eaten = self._try_eat_cell(cell, organism)
@@ -189,24 +342,35 @@ class World:
                         ate_cell_count += 1
                         if self.stats:
                             self.stats.record_cell_eaten()
-                        logger.debug(f"Cell {cell_id} successfully ate another cell")
-            
-            # Death check
-            if cell.energy <= 0:
-                dead_cells.append(cell_id)
-                logger.debug(f"Cell {cell_id} marked for death (energy: {cell.energy})")
+                        if __debug__ and _DEBUG:
+                            logger.debug("Cell %d successfully ate another cell", cell_id)
             
-            # Reproduction check
-            elif cell.energy > Config.REPRODUCTION_THRESHOLD:
+            # Reproduction check (death moved to the vectorized sweep
+            # below; a cell at or below zero energy can never clear the
+            # reproduction threshold, so the ordering is preserved)
+            if cell.energy > Config.REPRODUCTION_THRESHOLD:
                 reproduced = self._try_reproduce(cell, organism)
                 if reproduced:
                     reproduced_count += 1
-                    logger.debug(f"Cell {cell_id} successfully reproduced")
-        
+                    if __debug__ and _DEBUG:
+                        logger.debug("Cell %d successfully reproduced", cell_id)
+        
+        # Vectorized death sweep: one mask over the store replaces the
+        # per-cell energy check, and the decay food for every swept death
+        # drops in a single bulk write instead of a spawn_food call each
+        dead_slots = np.nonzero(store.alive & (store.energy <= 0))[0]
+        swept_ids = []
+        if dead_slots.size:
+            self.food_system._spawn_bulk(store.x[dead_slots], store.y[dead_slots],
+                                         Config.DECAY_FOOD_ENERGY)
+            swept_ids = store.cell_id[dead_slots].tolist()
+
         # Process deaths
-        death_count = len(dead_cells)
+        death_count = len(dead_cells) + len(swept_ids)
         for cell_id in dead_cells:
             self._kill_cell(cell_id)
+        for cell_id in swept_ids:
+            self._kill_cell(cell_id, drop_food=False)
         
         # Update food
         self.food_system.regenerate()
@@ -233,8 +397,7 @@ class World:
     
     def _move_cell(self, cell):
         """Move cell in random direction"""
-        directions = [(0,1), (1,0), (0,-1), (-1,0)]
-        random.shuffle(directions)
+        directions = _DIR_PERMS[random.randrange(24)]
         
         for dx, dy in directions:
             new_x = cell.x + dx
@@ -243,9 +406,7 @@ class World:
             if (0 <= new_x < self.width and 0 <= new_y < self.height and
                 not self.walls[new_x, new_y]):
                 
-                # Check cell stacking limit
-                existing_cells = self._get_cells_at_position(new_x, new_y)
-                if len(existing_cells) < Config.MAX_CELLS_PER_LOCATION:
+                if self._has_space(new_x, new_y):
                     # Update spatial hash
                     self._remove_from_spatial_hash(cell)
                     cell.x = new_x
@@ -261,21 +422,36 @@ class World:
                     
                     return True
         
-        logger.debug(f"Cell {cell.id} could not move - all adjacent spaces blocked or full")
+        if __debug__ and _DEBUG:
+            logger.debug("Cell %d could not move - all adjacent spaces blocked or full", cell.id)
         return False
     
     def _try_eat_cell(self, predator, pred_organism):
         """Try to eat adjacent cells"""
-        adjacent = self._get_adjacent_cells(predator.x, predator.y)
-        
-        for target in adjacent:
-            if target.organism_id != predator.organism_id:
-                # Eat the cell
-                energy_gained = target.energy // 2
-                predator.energy += energy_gained
-                logger.debug(f"Cell {predator.id} ate cell {target.id} and gained {energy_gained} energy")
-                self._kill_cell(target.id)
-                return True
+        # Probe the neighborhood directly and stop at the first edible
+        # cell instead of materializing the full adjacency list first
+        px, py = predator.x, predator.y
+        pred_org_id = predator.organism_id
+        occupancy = self.occupancy
+        width, height = self.width, self.height
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            nx = px + dx
+            ny = py + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            target_id = occupancy[nx, ny]
+            if target_id < 0:
+                continue
+            target = self.cells.get(int(target_id))
+            if target is None or target.organism_id == pred_org_id:
+                continue
+            # Eat the cell
+            energy_gained = target.energy // 2
+            predator.energy += energy_gained
+            if __debug__ and _DEBUG:
+                logger.debug("Cell %d ate cell %d and gained %d energy", predator.id, target.id, energy_gained)
+            self._kill_cell(target.id)
+            return True
         
         return False
     
@@ -292,34 +468,30 @@ class World:
             if (0 <= new_x < self.width and 0 <= new_y < self.height and
                 not self.walls[new_x, new_y]):
                 
-                # Check cell stacking limit
-                existing_cells = self._get_cells_at_position(new_x, new_y)
-                if len(existing_cells) < Config.MAX_CELLS_PER_LOCATION:
+                if self._has_space(new_x, new_y):
                     # Mutate genome
                     new_genome = self.dna_parser.mutate(organism.genome)
-                    new_traits = self.dna_parser.parse(new_genome)
-                    
-                    if new_traits:
+                    new_parsed = self.dna_parser.parse(new_genome)
+
+                    if new_parsed:
                         # Create offspring
-                        offspring = Organism(self.next_organism_id, new_genome, new_traits)
+                        offspring = Organism(self._alloc_organism_id(), new_genome, new_parsed)
                         offspring.birth_tick = self.tick_counter
-                        self.organisms[self.next_organism_id] = offspring
+                        self.organisms[offspring.id] = offspring
+                        self._record_organism_color(offspring)
                         
-                        logger.debug(f"Reproduction: Parent genome '{organism.genome}' -> "
-                                   f"Offspring genome '{new_genome}'")
+                        if __debug__ and _DEBUG:
+                            logger.debug("Reproduction: Parent genome '%s' -> Offspring genome '%s'",
+                                         organism.genome, new_genome)
                         
                         # Record mutation if genome changed
                         if new_genome != organism.genome and self.stats:
                             self.stats.record_mutation(organism.genome, new_genome)
                         
-                        self.next_organism_id += 1
-                        
                         # Create offspring cell
-                        offspring_cell = Cell(self.next_cell_id, new_x, new_y, offspring.id)
-                        offspring_cell.energy = Config.STARTING_ENERGY - len(new_genome)
-                        self.cells[self.next_cell_id] = offspring_cell
+                        offspring_cell = self._create_cell(new_x, new_y, offspring.id,
+                                                           Config.STARTING_ENERGY - len(new_genome))
                         offspring.cell_ids.add(offspring_cell.id)
-                        self.next_cell_id += 1
                         
                         # Update spatial hash
                         self._update_spatial_hash(offspring_cell)
@@ -339,20 +511,27 @@ class World:
                         logger.warning(f"Reproduction failed: mutated genome '{new_genome}' "
                                      f"produced no valid traits")
         
-        logger.debug(f"Cell {cell.id} could not reproduce - no adjacent empty spaces")
+        if __debug__ and _DEBUG:
+            logger.debug("Cell %d could not reproduce - no adjacent empty spaces", cell.id)
         return False
     
-    def _kill_cell(self, cell_id):
-        """Remove cell and potentially organism"""
+    def _kill_cell(self, cell_id, drop_food=True):
+        """Remove cell and potentially organism.
+
+        drop_food=False skips the decay-food spawn for callers that
+        already dropped it in bulk (the death sweep in update).
+        """
         cell = self.cells.get(cell_id)
         if not cell:
             logger.warning(f"Attempted to kill non-existent cell {cell_id}")
             return
         
-        logger.debug(f"Killing cell {cell_id} at ({cell.x}, {cell.y}) with {cell.energy} energy")
+        if __debug__ and _DEBUG:
+            logger.debug("Killing cell %d at (%d, %d) with %d energy", cell_id, cell.x, cell.y, cell.energy)
             
         # Leave decay food - ENHANCED
-        self.food_system.spawn_food(cell.x, cell.y, Config.DECAY_FOOD_ENERGY)
+        if drop_food:
+            self.food_system.spawn_food(cell.x, cell.y, Config.DECAY_FOOD_ENERGY)
         
         # Remove from spatial hash
         self._remove_from_spatial_hash(cell)
@@ -371,57 +550,90 @@ class World:
                 
                 logger.info(f"Organism {organism.id} died (last cell removed)")
                 del self.organisms[organism.id]
+                self._free_organism_ids.append(organism.id)
         
-        # Remove cell
+        # Remove cell and recycle its store slot
+        self.cell_store.free(cell._slot)
         del self.cells[cell_id]
     
+    def cells_in_region(self, x1, y1, x2, y2):
+        """Iterate cells inside the given world-space AABB.
+
+        Scans only the occupancy subgrid covering the region, so the cost
+        scales with the area queried instead of the total population.
+
+        Public spatial query API (like get_cell_at); the renderer no
+        longer uses it for culling, but it is kept for external callers
+        and tooling.
+        """
+        x1 = max(0, int(x1))
+        y1 = max(0, int(y1))
+        x2 = min(self.width - 1, int(x2))
+        y2 = min(self.height - 1, int(y2))
+        if x1 > x2 or y1 > y2:
+            return
+
+        region = self.occupancy[x1:x2 + 1, y1:y2 + 1]
+        for cell_id in region[region >= 0]:
+            cell = self.cells.get(int(cell_id))
+            if cell is not None:
+                yield cell
+
+    def wall_coords(self):
+        """Cached coordinate arrays of all wall positions.
+
+        Walls only change at setup/load time, so the renderer can reuse
+        these arrays every frame instead of re-scanning the wall grid.
+        """
+        if self._wall_coords is None:
+            coords = np.argwhere(self.walls).astype(np.int32)
+            self._wall_coords = (coords[:, 0], coords[:, 1])
+        return self._wall_coords
+
     def get_cell_at(self, x, y):
         """Get first cell at position (for compatibility)"""
         cells = self._get_cells_at_position(x, y)
         return cells[0] if cells else None
     
-    def _get_adjacent_cells(self, x, y):
-        """Get all cells adjacent to position"""
-        adjacent = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                cells = self._get_cells_at_position(x + dx, y + dy)
-                adjacent.extend(cells)
-        return adjacent
-    
-    def _get_hash(self, x, y):
-        """Spatial hash function"""
-        return (x // 16, y // 16)
-    
     def _update_spatial_hash(self, cell):
-        """Add cell to spatial hash"""
-        hash_key = self._get_hash(cell.x, cell.y)
-        self.spatial_hash[hash_key].add(cell.id)
+        """Mark the cell's position occupied"""
+        self.occupancy[cell.x, cell.y] = cell.id
     
     def _remove_from_spatial_hash(self, cell):
-        """Remove cell from spatial hash"""
-        hash_key = self._get_hash(cell.x, cell.y)
-        self.spatial_hash[hash_key].discard(cell.id)
+        """Mark the cell's position empty"""
+        self.occupancy[cell.x, cell.y] = -1
     
     def to_dict(self):
         """Convert world to JSON-serializable dict"""
         logger.debug("Converting world to dictionary for serialization")
         
+        # Gather every live cell's owner and coordinates from the SoA
+        # store in one pass and split them per organism, instead of a
+        # dict lookup and tuple construction per cell
+        store = self.cell_store
+        slots = np.nonzero(store.alive)[0]
+        org_ids = store.organism_id[slots]
+        order = np.argsort(org_ids, kind='stable')
+        coords = np.column_stack((store.x[slots][order],
+                                  store.y[slots][order])).tolist()
+        sorted_ids = org_ids[order]
+        uniq, starts = np.unique(sorted_ids, return_index=True)
+        bounds = starts[1:].tolist() + [len(coords)]
+        cells_by_org = {org_id: coords[a:b] for org_id, a, b
+                        in zip(uniq.tolist(), starts.tolist(), bounds)}
+        
         result = {
             "width": self.width,
             "height": self.height,
             "organisms": [
                 {
                     "genome": org.genome,
-                    "cells": [(self.cells[cid].x, self.cells[cid].y) 
-                             for cid in org.cell_ids if cid in self.cells]
+                    "cells": cells_by_org.get(org.id, [])
                 }
                 for org in self.organisms.values()
             ],
             "food": self.food_system.to_dict(),
-            "walls": [(int(x), int(y)) for x, y in zip(*self.walls.nonzero())]
+            "walls": np.argwhere(self.walls).tolist()
         }
         
         logger.debug(f"World serialization complete: {len(result['organisms'])} organisms, "
@@ -435,16 +647,18 @@ class World:
         
         world = cls(data["width"], data["height"])
         
-        # Load walls
-        wall_count = 0
-        for x, y in data.get("walls", []):
-            world.walls[x, y] = True
-            wall_count += 1
-        logger.debug(f"Loaded {wall_count} walls")
+        # Load walls with one fancy-index store instead of a Python
+        # loop per wall
+        walls_data = data.get("walls", [])
+        if walls_data:
+            coords = np.asarray(walls_data, dtype=np.int32)
+            world.walls[coords[:, 0], coords[:, 1]] = True
+        world._wall_coords = None  # Invalidate the cached render coords
+        logger.debug(f"Loaded {len(walls_data)} walls")
         
         # Load food
         world.food_system = FoodSystem.from_dict(data["food"], data["width"], data["height"])
-        food_count = len(world.food_system.food_energy)
+        food_count = world.food_system.food_count
         logger.debug(f"Loaded {food_count} food items")
         
         # Load organisms
@@ -463,6 +677,6 @@ class World:
                     pass
         
         logger.info(f"World loaded successfully: {organism_count} organisms, "
-                   f"{food_count} food items, {wall_count} walls")
+                   f"{food_count} food items, {len(walls_data)} walls")
         
         return world
\ No newline at end of file